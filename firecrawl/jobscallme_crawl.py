@@ -1,33 +1,58 @@
 import json
+import logging
 import os
+import hashlib
+import re
 import datetime
 import argparse
 import asyncio
-import aiohttp
+import itertools
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
-from firecrawl import Firecrawl
-from bs4 import BeautifulSoup
-import html2text
+from functools import lru_cache
 from dateutil import parser
 from dateutil.relativedelta import relativedelta
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used instead
+    orjson = None
+
+# Heavy client/parser libraries are imported where they are first used, so
+# --help, env checks and link filtering don't pay their import cost
+if TYPE_CHECKING:
+    import html2text
+    from firecrawl import Firecrawl
+
+log = logging.getLogger(__name__)
+
 
 @dataclass
 class CrawlerConfig:
     """Configuration for the JobscallMe crawler."""
     base_url: str = "http://localhost:3002"
     target_date: Optional[datetime.date] = None
-    concurrency: int = 5
+    concurrency: int = 8
     max_jobs: int = 500
     target_site_url: str = "https://www.jobscall.me/job"
     excluded_urls: List[str] = None
+    force_rescrape: bool = False
+    batch_scrape: bool = False
+    batch_size: int = 50
+    pretty_json: bool = False
+    markdown_backend: str = "lxml"
+    probe_cutoff: bool = False
+    compress_html: bool = False
+    map_cache_ttl: int = 6 * 3600  # seconds a cached site map stays valid
     
     def __post_init__(self):
         if self.excluded_urls is None:
             self.excluded_urls = ['/job/jobscallmefb']
         self.concurrency = max(1, self.concurrency)
+        self.batch_size = max(1, self.batch_size)
 
 
 class DateUtils:
@@ -45,36 +70,93 @@ class DateUtils:
             return None
     
     @staticmethod
-    def is_job_too_old(time_value: str) -> bool:
-        """Check if a job posting is older than 1 month."""
+    @lru_cache(maxsize=4096)
+    def parse_job_datetime(time_value: str) -> datetime.datetime:
+        """Parse a posting timestamp into a naive datetime.
+        
+        <time datetime=...> values are ISO 8601, which fromisoformat handles far
+        faster than dateutil; anything else falls back to dateutil. The offset
+        is dropped so the result compares against naive local cutoffs. Results
+        are memoized, since many postings share a timestamp and each page's
+        value is parsed more than once.
+        """
+        try:
+            parsed_dt = datetime.datetime.fromisoformat(time_value.replace('Z', '+00:00'))
+        except ValueError:
+            parsed_dt = parser.parse(time_value)
+        return parsed_dt.replace(tzinfo=None)
+    
+    @staticmethod
+    def one_month_cutoff() -> datetime.datetime:
+        """Postings older than this are outside the default crawl window."""
+        return datetime.datetime.now() - relativedelta(months=1)
+    
+    @staticmethod
+    def is_job_too_old(time_value: Union[str, datetime.datetime],
+                       cutoff_date: Optional[datetime.datetime] = None) -> bool:
+        """Check if a job posting (timestamp string or parsed datetime) is older than 1 month or the given cutoff."""
         try:
-            job_date = parser.parse(time_value)
-            current_date = datetime.datetime.now()
-            cutoff_date = current_date - relativedelta(months=1)
+            if isinstance(time_value, datetime.datetime):
+                job_date = time_value
+            else:
+                job_date = DateUtils.parse_job_datetime(time_value)
+            if cutoff_date is None:
+                cutoff_date = DateUtils.one_month_cutoff()
             cutoff_desc = "the last month"
             
             is_old = job_date < cutoff_date
             
             if is_old:
-                print(f"📅 Job date {job_date.strftime('%Y-%m-%d')} is older than cutoff {cutoff_date.strftime('%Y-%m-%d')} ({cutoff_desc})")
+                log.debug("📅 Job date %s is older than cutoff %s (%s)", job_date.date(), cutoff_date.date(), cutoff_desc)
             else:
-                print(f"📅 Job date {job_date.strftime('%Y-%m-%d')} is within {cutoff_desc}")
+                log.debug("📅 Job date %s is within %s", job_date.date(), cutoff_desc)
             
             return is_old
             
         except Exception as e:
-            print(f"⚠️ Could not parse date '{time_value}': {e}")
+            log.warning("⚠️ Could not parse date '%s': %s", time_value, e)
             return False
 
 
 class HtmlProcessor:
     """Handles HTML content processing and conversion."""
     
-    def __init__(self):
-        self.html2text_converter = self._setup_html2text()
+    # Compiled once (on first use) and evaluated in C for every page
+    _ARTICLE_XPATH = None
+    _TIME_XPATH = None
+    
+    MARKDOWN_BACKENDS = ("html2text", "lxml")
+    
+    # Tags handled by the lxml Markdown serializer
+    _SKIP_TAGS = frozenset({'head', 'script', 'style', 'noscript', 'template', 'iframe', 'svg'})
+    _BLOCK_TAGS = frozenset({
+        'p', 'div', 'section', 'article', 'main', 'header', 'footer', 'aside',
+        'nav', 'form', 'figure', 'figcaption', 'dl', 'dt', 'dd', 'address'
+    })
+    _HEADING_LEVELS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+    _WHITESPACE_RE = re.compile(r'\s+')
+    _TRAILING_SPACE_RE = re.compile(r'[ \t]+\n')
+    _BLANK_LINES_RE = re.compile(r'\n{3,}')
+    
+    def __init__(self, markdown_backend: str = "lxml"):
+        if markdown_backend not in self.MARKDOWN_BACKENDS:
+            raise ValueError(f"Unknown markdown backend: {markdown_backend}")
+        self.markdown_backend = markdown_backend
+        # HTML2Text keeps parse state on the instance, so each thread gets its own
+        self._html2text_local = threading.local()
     
-    def _setup_html2text(self) -> html2text.HTML2Text:
+    @property
+    def html2text_converter(self) -> "html2text.HTML2Text":
+        """This thread's html2text converter, configured on first use."""
+        converter = getattr(self._html2text_local, 'converter', None)
+        if converter is None:
+            converter = self._html2text_local.converter = self._setup_html2text()
+        return converter
+    
+    def _setup_html2text(self) -> "html2text.HTML2Text":
         """Configure html2text converter."""
+        import html2text
+        
         h = html2text.HTML2Text()
         h.ignore_links = False
         h.ignore_images = False
@@ -82,129 +164,500 @@ class HtmlProcessor:
         h.body_width = 0
         return h
     
+    @staticmethod
+    def _article_region(html_content: str) -> str:
+        """Slice out the <article> markup so the parser skips head/nav/footer."""
+        start = html_content.find('<article')
+        end = html_content.rfind('</article>')
+        if start == -1 or end < start:
+            return html_content
+        # A '<article' inside a script block is not a real tag; parse everything
+        if html_content.rfind('<script', 0, start) > html_content.rfind('</script>', 0, start):
+            return html_content
+        return html_content[start:end + len('</article>')]
+    
     def extract_article_content(self, html_content: str) -> Dict:
         """Extract article content and metadata from HTML."""
         result = {
             'html_content': None,
+            'article_node': None,
             'article_found': False,
             'time_value': None,
-            'job_date': None
+            'job_date': None,
+            'job_datetime': None
         }
         
+        from lxml import etree, html as lxml_html
+        
+        if HtmlProcessor._ARTICLE_XPATH is None:
+            HtmlProcessor._ARTICLE_XPATH = etree.XPath('(descendant-or-self::article)[1]')
+            HtmlProcessor._TIME_XPATH = etree.XPath('(.//time)[1]')
+        
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            article = soup.find('article')
+            root = lxml_html.fromstring(self._article_region(html_content))
+            articles = self._ARTICLE_XPATH(root)
             
-            if article:
-                print(f"✅ Found <article> tag, extracting content")
-                result['html_content'] = str(article)
+            if articles:
+                article = articles[0]
+                log.debug("✅ Found <article> tag, extracting content")
+                result['html_content'] = etree.tostring(article, encoding='unicode', method='html', with_tail=False)
+                result['article_node'] = article
                 result['article_found'] = True
                 
                 # Extract time information
-                time_tag = article.find('time')
-                if time_tag:
-                    time_value = time_tag.get('datetime', time_tag.text.strip())
+                time_tags = self._TIME_XPATH(article)
+                if time_tags:
+                    time_tag = time_tags[0]
+                    time_value = time_tag.get('datetime', time_tag.text_content().strip())
                     result['time_value'] = time_value
-                    print(f"✅ Found <time> tag: {time_value}")
+                    log.debug("✅ Found <time> tag: %s", time_value)
                     
                     try:
-                        parsed_dt = parser.parse(time_value)
+                        parsed_dt = DateUtils.parse_job_datetime(time_value)
+                        result['job_datetime'] = parsed_dt
                         result['job_date'] = parsed_dt.date().isoformat()
                     except Exception:
                         pass
                 else:
-                    print(f"⚠️ No <time> tag found within article")
+                    log.debug("⚠️ No <time> tag found within article")
             else:
-                print(f"⚠️ No <article> tag found, returning full HTML")
+                log.debug("⚠️ No <article> tag found, returning full HTML")
                 result['html_content'] = html_content
+                result['article_node'] = root
             
             return result
         except Exception as e:
-            print(f"❌ Error parsing HTML: {str(e)}")
+            log.error("❌ Error parsing HTML: %s", e)
             return {'html_content': html_content, 'article_found': False, 'time_value': None}
     
-    def html_to_markdown(self, html_content: str) -> str:
-        """Convert HTML content to Markdown."""
+    def html_to_markdown(self, html_content: str, node=None) -> str:
+        """Convert HTML content to Markdown.
+        
+        With the lxml backend, an already-parsed element from
+        extract_article_content can be passed as `node` to skip re-parsing.
+        """
+        if self.markdown_backend == "lxml":
+            if node is None:
+                from lxml import html as lxml_html
+                node = lxml_html.fromstring(html_content)
+            return self.node_to_markdown(node)
         return self.html2text_converter.handle(html_content)
+    
+    def node_to_markdown(self, node) -> str:
+        """Serialize an lxml element tree to Markdown."""
+        markdown = self._render_children(node, 0)
+        markdown = self._TRAILING_SPACE_RE.sub('\n', markdown)
+        markdown = self._BLANK_LINES_RE.sub('\n\n', markdown)
+        return markdown.strip() + '\n'
+    
+    def _render_children(self, node, depth: int) -> str:
+        """Render an element's text, children and their tails."""
+        parts = []
+        if node.text:
+            parts.append(self._WHITESPACE_RE.sub(' ', node.text))
+        for child in node:
+            if isinstance(child.tag, str):
+                parts.append(self._render_node(child, depth))
+            if child.tail:
+                parts.append(self._WHITESPACE_RE.sub(' ', child.tail))
+        return ''.join(parts)
+    
+    def _render_node(self, node, depth: int) -> str:
+        """Render a single element (without its tail) as Markdown."""
+        tag = node.tag
+        if tag in self._SKIP_TAGS:
+            return ''
+        if tag in self._HEADING_LEVELS:
+            text = self._render_children(node, depth).strip()
+            return f"\n\n{'#' * self._HEADING_LEVELS[tag]} {text}\n\n" if text else ''
+        if tag in self._BLOCK_TAGS:
+            return f"\n\n{self._render_children(node, depth).strip()}\n\n"
+        if tag == 'br':
+            return '\n'
+        if tag == 'hr':
+            return '\n\n* * *\n\n'
+        if tag == 'a':
+            text = self._render_children(node, depth).strip()
+            href = node.get('href')
+            return f"[{text}]({href})" if href and text else text
+        if tag == 'img':
+            src = node.get('src')
+            return f"![{node.get('alt', '')}]({src})" if src else ''
+        if tag in ('strong', 'b'):
+            text = self._render_children(node, depth).strip()
+            return f"**{text}**" if text else ''
+        if tag in ('em', 'i'):
+            text = self._render_children(node, depth).strip()
+            return f"_{text}_" if text else ''
+        if tag == 'code':
+            return f"`{node.text_content()}`"
+        if tag == 'pre':
+            code = node.text_content().strip('\n')
+            return f"\n\n```\n{code}\n```\n\n"
+        if tag == 'blockquote':
+            text = self._render_children(node, depth).strip()
+            return '\n\n' + '\n'.join(f"> {line}" for line in text.splitlines()) + '\n\n'
+        if tag in ('ul', 'ol'):
+            return self._render_list(node, depth)
+        if tag == 'table':
+            return self._render_table(node, depth)
+        return self._render_children(node, depth)
+    
+    def _render_list(self, node, depth: int) -> str:
+        """Render <ul>/<ol> items, indenting nested lists."""
+        indent = '  ' * depth
+        lines = []
+        number = 0
+        for item in node:
+            if item.tag != 'li':
+                continue
+            number += 1
+            marker = f"{number}." if node.tag == 'ol' else '-'
+            text = self._render_children(item, depth + 1).strip()
+            lines.append(f"{indent}{marker} {text}")
+        return '\n\n' + '\n'.join(lines) + '\n\n' if depth == 0 else '\n' + '\n'.join(lines)
+    
+    def _render_table(self, node, depth: int) -> str:
+        """Render a table as pipe rows, with a separator after the first row."""
+        rows = []
+        for row in node.iter('tr'):
+            cells = [self._render_children(cell, depth).strip().replace('|', '\\|')
+                     for cell in row if cell.tag in ('td', 'th')]
+            rows.append(f"| {' | '.join(cells)} |")
+            if len(rows) == 1:
+                rows.append('|' + ' --- |' * len(cells))
+        return '\n\n' + '\n'.join(rows) + '\n\n' if rows else ''
+
+
+class JobSummaryLog:
+    """Per-job JSON Lines record of a crawl, appended as each job is saved.
+    
+    Unlike scraping_summary.json, which is written once at the end, this
+    survives an interrupted run.
+    """
+    
+    def __init__(self, path: str, jobs: List[Dict] = ()):
+        self.path = path
+        # Unbuffered: each record reaches the file in one write
+        self._file = open(path, 'wb', buffering=0)
+        for job_info in jobs:
+            self.write(job_info)
+    
+    def write(self, job_info: Dict):
+        """Append one job record."""
+        if orjson is not None:
+            line = orjson.dumps(job_info, option=orjson.OPT_APPEND_NEWLINE)
+        else:
+            line = (json.dumps(job_info, ensure_ascii=False) + '\n').encode('utf-8')
+        self._file.write(line)
+    
+    def close(self):
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
 
 class FileManager:
     """Handles file operations and directory management."""
     
-    def __init__(self, base_dir: str = None):
+    # Path separators and characters Windows forbids in file names. Everything
+    # else (including %-encoding) is kept, since the extractor rebuilds
+    # job_url from the file stem.
+    _FILENAME_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+    # Stems longer than this (in UTF-8 bytes) would not fit the 255-byte file
+    # name limit once extensions are added
+    _MAX_STEM_BYTES = 200
+    
+    def __init__(self, base_dir: str = None, pretty_json: bool = False, compress_html: bool = False):
         self.base_dir = base_dir or os.path.dirname(os.path.abspath(__file__))
+        self.job_data_dir = os.path.join(self.base_dir, "job-data")
+        # Summaries are machine-read; indentation is opt-in
+        self.json_indent = 2 if pretty_json else None
+        
+        # Saved job HTML is mostly repeated page boilerplate and compresses ~10x
+        self._zstd = None
+        self.html_suffix = ".html"
+        if compress_html:
+            try:
+                import zstandard
+                self._zstd = zstandard
+                self.html_suffix = ".html.zst"
+            except ImportError:
+                print("⚠️  zstandard is not installed; saving uncompressed HTML")
     
     def create_date_directories(self, date_folder: str) -> Tuple[str, str, str]:
         """Create directory structure for a given date."""
-        date_dir = os.path.join(self.base_dir, "job-data", date_folder)
+        date_dir = os.path.join(self.job_data_dir, date_folder)
         jobscallme_dir = os.path.join(date_dir, "jobscallme")
         html_dir = os.path.join(jobscallme_dir, "html")
         md_dir = os.path.join(jobscallme_dir, "markdown")
         
-        for directory in [date_dir, jobscallme_dir, html_dir, md_dir]:
+        # makedirs creates the date and jobscallme parents along the way
+        for directory in (html_dir, md_dir):
             os.makedirs(directory, exist_ok=True)
         
         return html_dir, md_dir, date_dir
     
-    def save_job_files(self, job_url: str, html_content: str, markdown_content: str, 
-                      html_dir: str, md_dir: str, index_hint: int) -> Dict:
-        """Save job content to HTML and Markdown files."""
-        url_path = job_url.split('/job/')[-1] if '/job/' in job_url else f"job_{index_hint}"
-        html_filename = f"{url_path}.html"
+    def open_summary_log(self, date_dir: str, jobs: List[Dict] = ()) -> JobSummaryLog:
+        """Start today's scraping_summary.jsonl, seeded with already-known jobs."""
+        return JobSummaryLog(os.path.join(date_dir, "scraping_summary.jsonl"), jobs)
+    
+    def job_file_stem(self, job_url: str, index_hint: int) -> str:
+        """File name (without extension) used for a job's saved pages."""
+        _, sep, slug = job_url.rpartition('/job/')
+        if not (sep and slug):
+            return f"job_{index_hint}"
+        stem = slug.translate(self._FILENAME_TRANS)
+        encoded = stem.encode('utf-8')
+        if len(encoded) > self._MAX_STEM_BYTES:
+            # Keep over-long slugs distinct with a hash of the full slug
+            digest = hashlib.sha1(slug.encode('utf-8')).hexdigest()[:10]
+            stem = f"{encoded[:self._MAX_STEM_BYTES - 11].decode('utf-8', 'ignore')}-{digest}"
+        return stem
+    
+    def find_saved_job_files(self, job_url: str, html_dir: str, md_dir: str, index_hint: int) -> Optional[Dict]:
+        """Return file metadata if this job was already saved, else None.
+        
+        The HTML file is written last, so its presence marks a complete save;
+        pages without an article have no Markdown file.
+        """
+        url_path = self.job_file_stem(job_url, index_hint)
+        html_filename = f"{url_path}{self.html_suffix}"
         md_filename = f"{url_path}.md"
+        try:
+            html_length = os.path.getsize(os.path.join(html_dir, html_filename))
+        except OSError:
+            return None
+        try:
+            md_length = os.path.getsize(os.path.join(md_dir, md_filename))
+        except OSError:
+            md_filename, md_length = None, 0
+        return {
+            "html_filename": html_filename,
+            "md_filename": md_filename,
+            "html_length": html_length,
+            "md_length": md_length
+        }
+    
+    def save_job_files(self, job_url: str, html_content: str, markdown_content: Optional[str], 
+                      html_dir: str, md_dir: str, index_hint: int) -> Dict:
+        """Save job content to HTML and (when given) Markdown files."""
+        url_path = self.job_file_stem(job_url, index_hint)
+        html_filename = f"{url_path}{self.html_suffix}"
+        md_filename = f"{url_path}.md" if markdown_content is not None else None
         
-        # Save HTML content
-        html_output_file = os.path.join(html_dir, html_filename)
-        with open(html_output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Encode once and write bytes, skipping the text-layer codec
+        if md_filename:
+            md_output_file = os.path.join(md_dir, md_filename)
+            with open(md_output_file, 'wb') as f:
+                f.write(markdown_content.encode('utf-8'))
         
-        # Save Markdown content
-        md_output_file = os.path.join(md_dir, md_filename)
-        with open(md_output_file, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+        html_output_file = os.path.join(html_dir, html_filename)
+        html_bytes = html_content.encode('utf-8')
+        if self._zstd is not None:
+            html_bytes = self._zstd.compress(html_bytes, 3)
+        with open(html_output_file, 'wb') as f:
+            f.write(html_bytes)
         
         return {
             "html_filename": html_filename,
             "md_filename": md_filename,
             "html_length": len(html_content),
-            "md_length": len(markdown_content)
+            "md_length": len(markdown_content) if markdown_content is not None else 0
         }
     
+    def _write_json(self, path: str, payload: Dict):
+        """Write a JSON document, using orjson when it is installed."""
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if self.json_indent else 0
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(payload, option=option))
+        else:
+            # json.dump issues a write per token; serialize once and write bytes
+            data = json.dumps(payload, indent=self.json_indent, ensure_ascii=False).encode('utf-8')
+            with open(path, 'wb') as f:
+                f.write(data)
+    
+    def _write_json_list(self, path: str, header: Dict, list_key: str, items: List):
+        """Write header fields plus one list as JSON, streaming the list item by item.
+        
+        Only one item is serialized at a time, and an interrupted run leaves a
+        readable prefix instead of an empty file. Pretty output is written in
+        one piece, since indenting needs the whole document.
+        """
+        if self.json_indent:
+            self._write_json(path, {**header, list_key: items})
+            return
+        
+        dumps = (lambda obj: orjson.dumps(obj).decode('utf-8')) if orjson is not None \
+            else (lambda obj: json.dumps(obj, ensure_ascii=False, separators=(',', ':')))
+        with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(dumps(header)[:-1])
+            f.write(f',{dumps(list_key)}:[')
+            for i, item in enumerate(items):
+                if i:
+                    f.write(',')
+                f.write(dumps(item))
+            f.write(']}')
+    
     def save_results_summary(self, links: List[str], scraped_jobs: List[Dict], date_folder: str):
         """Save crawling results summary to JSON files."""
-        date_dir = os.path.join(self.base_dir, "job-data", date_folder)
+        date_dir = os.path.join(self.job_data_dir, date_folder)
         os.makedirs(date_dir, exist_ok=True)
         
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Save discovered links
         links_file = os.path.join(date_dir, "jobscall_me_links.json")
-        with open(links_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                "url": "https://www.jobscall.me/job",
-                "timestamp": timestamp,
-                "total_links": len(links),
-                "links": links
-            }, f, indent=2, ensure_ascii=False)
+        self._write_json_list(links_file, {
+            "url": "https://www.jobscall.me/job",
+            "timestamp": timestamp,
+            "total_links": len(links)
+        }, "links", links)
         
         print(f"\n💾 Links saved to: {links_file}")
         
         # Save scraping summary
         if scraped_jobs:
             summary_file = os.path.join(date_dir, "scraping_summary.json")
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "source": "jobscall.me",
-                    "timestamp": timestamp,
-                    "total_jobs": len(scraped_jobs),
-                    "scraped_jobs": scraped_jobs
-                }, f, indent=2, ensure_ascii=False)
+            self._write_json_list(summary_file, {
+                "source": "jobscall.me",
+                "timestamp": timestamp,
+                "total_jobs": len(scraped_jobs)
+            }, "scraped_jobs", scraped_jobs)
             
             print(f"💾 Scraping summary saved to: {summary_file}")
             print(f"📁 HTML files saved in: {os.path.join(date_dir, 'jobscallme', 'html')}")
             print(f"📁 Markdown files saved in: {os.path.join(date_dir, 'jobscallme', 'markdown')}")
 
 
+class ScrapeCache:
+    """Persistent URL -> raw HTML cache so reruns skip already-scraped pages."""
+    
+    def __init__(self, job_data_dir: str):
+        self.cache_dir = os.path.join(job_data_dir, "cache")
+        self.index_file = os.path.join(self.cache_dir, "cache_index.json")
+        self.index = self._load_index()
+        self._dir_ready = False
+    
+    def _load_index(self) -> Dict:
+        """Load the URL index written by a previous run, if any."""
+        try:
+            with open(self.index_file, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return {}
+        try:
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except ValueError:
+            return {}
+    
+    def get(self, url: str) -> Optional[str]:
+        """Return cached HTML for a URL, or None on a miss."""
+        entry = self.index.get(url)
+        if not entry:
+            return None
+        try:
+            with open(os.path.join(self.cache_dir, entry['path']), 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def _ensure_dir(self):
+        """Create the cache directory on the first write only."""
+        if not self._dir_ready:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._dir_ready = True
+    
+    def put(self, url: str, html_content: str):
+        """Store the raw HTML for a URL."""
+        self._ensure_dir()
+        filename = f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.html"
+        with open(os.path.join(self.cache_dir, filename), 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        self.index[url] = {
+            "path": filename,
+            "ts": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+    
+    def _links_file(self, site_url: str) -> str:
+        """Path of the cached site map for a URL."""
+        return os.path.join(self.cache_dir, f"map_{hashlib.sha1(site_url.encode('utf-8')).hexdigest()}.json")
+    
+    def get_links(self, site_url: str, max_age: float) -> Optional[List[str]]:
+        """Return the mapped links for a site if they were cached less than max_age seconds ago."""
+        links_file = self._links_file(site_url)
+        try:
+            if time.time() - os.path.getmtime(links_file) >= max_age:
+                return None
+            with open(links_file, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except (OSError, ValueError):
+            return None
+    
+    def put_links(self, site_url: str, links: List[str]):
+        """Cache the mapped links for a site."""
+        self._ensure_dir()
+        if orjson is not None:
+            data = orjson.dumps(links)
+        else:
+            data = json.dumps(links, ensure_ascii=False).encode('utf-8')
+        with open(self._links_file(site_url), 'wb') as f:
+            f.write(data)
+    
+    def save(self):
+        """Persist the URL index."""
+        if not self.index:
+            return
+        self._ensure_dir()
+        # The index is machine-read only, so it is written compact
+        if orjson is not None:
+            data = orjson.dumps(self.index)
+        else:
+            data = json.dumps(self.index, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        with open(self.index_file, 'wb') as f:
+            f.write(data)
+
+
+class FirecrawlHttpClient:
+    """Sync Firecrawl client that keeps pooled keep-alive connections across calls."""
+    
+    def __init__(self, base_url: str, api_key: str = "localhost", pool_size: int = 10):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import Retry
+        
+        self.base_url = base_url.rstrip('/')
+        # Scrapes are idempotent, so POSTs are retried on transient failures too
+        retry = Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=(429, 500, 502, 503, 504), allowed_methods=None)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Connection": "keep-alive"
+        })
+    
+    def scrape(self, url: str) -> Optional[Dict]:
+        """Scrape a single URL, returning the raw API response."""
+        payload = {
+            "url": url,
+            "formats": ["html"]
+        }
+        response = self.session.post(f"{self.base_url}/v1/scrape", json=payload, timeout=60)
+        if response.status_code != 200:
+            log.warning("⚠️ HTTP %s for %s", response.status_code, url)
+            return None
+        return response.json()
+
+
 class AsyncFirecrawlClient:
     """Async wrapper for Firecrawl API calls."""
     
@@ -214,8 +667,13 @@ class AsyncFirecrawlClient:
         self.session = None
     
     async def __aenter__(self):
-        connector = aiohttp.TCPConnector(limit=100, limit_per_host=50)
-        timeout = aiohttp.ClientTimeout(total=30, connect=10)
+        import aiohttp
+        
+        # Every request goes to the same Firecrawl host: keep idle connections
+        # around between pages and resolve its name once per crawl
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=50,
+                                         keepalive_timeout=75, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=60, connect=10)
         self.session = aiohttp.ClientSession(
             connector=connector,
             timeout=timeout,
@@ -230,7 +688,7 @@ class AsyncFirecrawlClient:
     async def scrape_async(self, url: str) -> Optional[Dict]:
         """Async scrape method using direct HTTP calls."""
         try:
-            scrape_url = f"{self.base_url}/v0/scrape"
+            scrape_url = f"{self.base_url}/v1/scrape"
             payload = {
                 "url": url,
                 "formats": ["html"]
@@ -239,31 +697,118 @@ class AsyncFirecrawlClient:
             async with self.session.post(scrape_url, json=payload) as response:
                 if response.status == 200:
                     result = await response.json()
-                    # Debug: Print response structure
-                    print(f"🔍 API Response structure: {list(result.keys()) if isinstance(result, dict) else type(result)}")
-                    
-                    # Return the full result for debugging, not just 'data'
+                    log.debug("🔍 API Response structure: %s", list(result.keys()) if isinstance(result, dict) else type(result))
                     return result
                 else:
-                    print(f"⚠️ HTTP {response.status} for {url}")
+                    log.warning("⚠️ HTTP %s for %s", response.status, url)
                     return None
         except asyncio.TimeoutError:
-            print(f"⏰ Timeout scraping {url}")
+            log.warning("⏰ Timeout scraping %s", url)
             return None
         except Exception as e:
-            print(f"❌ Error scraping {url}: {str(e)}")
+            log.error("❌ Error scraping %s: %s", url, e)
             return None
 
 
+    async def batch_scrape_async(self, urls: List[str], poll_interval: float = 2.0,
+                                 timeout: float = 600.0) -> Dict[str, Dict]:
+        """Scrape many URLs with one Firecrawl batch job, keyed by source URL.
+        
+        Returns {} if the batch fails, is cancelled or runs past `timeout`
+        seconds, so the caller falls back to scraping each URL on its own.
+        """
+        try:
+            payload = {
+                "urls": urls,
+                "formats": ["html"]
+            }
+            async with self.session.post(f"{self.base_url}/v1/batch/scrape", json=payload) as response:
+                if response.status != 200:
+                    log.warning("⚠️ HTTP %s starting batch scrape", response.status)
+                    return {}
+                batch_job = await response.json()
+            
+            # Poll while the batch is still running; any other status is final
+            status_url = f"{self.base_url}/v1/batch/scrape/{batch_job['id']}"
+            deadline = asyncio.get_running_loop().time() + timeout
+            while True:
+                async with self.session.get(status_url) as response:
+                    if response.status != 200:
+                        log.warning("⚠️ HTTP %s polling batch scrape %s", response.status, batch_job['id'])
+                        return {}
+                    status = await response.json()
+                state = status.get('status')
+                if state == 'completed':
+                    break
+                if state != 'scraping':
+                    log.error("❌ Batch scrape %s ended with status %r", batch_job['id'], state)
+                    return {}
+                if asyncio.get_running_loop().time() >= deadline:
+                    log.warning("⏰ Batch scrape %s still running after %ss; scraping pages singly", batch_job['id'], timeout)
+                    return {}
+                await asyncio.sleep(poll_interval)
+            
+            # Large batches are paginated through 'next'
+            documents = list(status.get('data') or [])
+            next_url = status.get('next')
+            while next_url:
+                async with self.session.get(next_url) as response:
+                    page = await response.json()
+                documents.extend(page.get('data') or [])
+                next_url = page.get('next')
+            
+            results = {}
+            for document in documents:
+                metadata = document.get('metadata') or {}
+                source_url = metadata.get('sourceURL') or metadata.get('url')
+                if source_url and document.get('html'):
+                    results[source_url] = {'data': document}
+            return results
+        except asyncio.TimeoutError:
+            log.warning("⏰ Timeout during batch scrape of %d URLs", len(urls))
+            return {}
+        except Exception as e:
+            log.error("❌ Error during batch scrape: %s", e)
+            return {}
+
+
 class JobscallMeCrawler:
     """Main crawler class for JobscallMe job postings."""
     
+    _JOB_LINK_RE = re.compile(r'/job/[^/]+$')
+    
     def __init__(self, config: CrawlerConfig = None):
         self.config = config or CrawlerConfig()
-        self.firecrawl = Firecrawl(api_key="localhost", api_url=self.config.base_url)
-        self.html_processor = HtmlProcessor()
-        self.file_manager = FileManager()
+        self._firecrawl = None
+        self._http_client = None
+        self.html_processor = HtmlProcessor(self.config.markdown_backend)
+        self.file_manager = FileManager(pretty_json=self.config.pretty_json,
+                                        compress_html=self.config.compress_html)
+        self.scrape_cache = ScrapeCache(self.file_manager.job_data_dir)
         self.date_utils = DateUtils()
+        # All exclusion substrings checked in one regex scan per link
+        self._excluded_re = re.compile('|'.join(map(re.escape, self.config.excluded_urls))) \
+            if self.config.excluded_urls else None
+        # Fixed once per crawl instead of recomputed for every page
+        self.cutoff_date = DateUtils.one_month_cutoff()
+    
+    @property
+    def firecrawl(self) -> "Firecrawl":
+        """Firecrawl SDK client (used for map), created on first use."""
+        if self._firecrawl is None:
+            from firecrawl import Firecrawl
+            self._firecrawl = Firecrawl(api_key="localhost", api_url=self.config.base_url)
+        return self._firecrawl
+    
+    @property
+    def http_client(self) -> FirecrawlHttpClient:
+        """Pooled client for sync page scrapes, created on first use.
+        
+        The SDK opens a new connection per request; page scrapes share one pool instead.
+        """
+        if self._http_client is None:
+            self._http_client = FirecrawlHttpClient(self.config.base_url, pool_size=self.config.concurrency)
+        return self._http_client
     
     def map_website(self, url: str) -> Optional[Dict]:
         try:
@@ -281,54 +826,63 @@ class JobscallMeCrawler:
             return None
     
     def extract_links(self, map_result) -> List[str]:
-        all_links = []
-        
-        if hasattr(map_result, 'links'):
-            for link_result in map_result.links:
-                if hasattr(link_result, 'url') and link_result.url:
-                    all_links.append(link_result.url)
-        elif isinstance(map_result, dict):
-            possible_keys = ['links', 'urls', 'data', 'results']
-            for key in possible_keys:
+        # SDK map results (objects with .links) are the common case, so try them first
+        try:
+            return [link_result.url for link_result in map_result.links
+                    if getattr(link_result, 'url', None)]
+        except AttributeError:
+            pass
+        
+        if isinstance(map_result, dict):
+            for key in ('links', 'urls', 'data', 'results'):
                 if key in map_result:
-                    all_links = map_result[key]
-                    break
+                    return map_result[key]
         elif isinstance(map_result, list):
-            all_links = map_result
+            return map_result
         
-        return all_links
+        return []
     
     def filter_job_links(self, all_links: List[str]) -> List[str]:
         """Filter links to only include valid job posting URLs."""
         filtered_links = []
         
         for link in all_links:
-            if '/job/' in link:
-                job_part = link.split('/job/')[-1]
-                
-                # Check if this is a URL we want to exclude
-                should_exclude = any(excluded_url in link for excluded_url in self.config.excluded_urls)
-                if should_exclude:
-                    print(f"🚫 Excluding specific URL: {link}")
-                    continue
-                
-                # Include valid job URLs
-                if (job_part and 
-                    '/' not in job_part and 
-                    not link.endswith('/job/') and
-                    '/job/category/' not in link and
-                    '/job/tag/' not in link):
-                    filtered_links.append(link)
+            # Cheap substring pre-check drops most non-job URLs before the regex runs
+            if '/job/' not in link:
+                continue
+            
+            # A job posting is a single path segment after the last '/job/'
+            # (this also rules out /job/category/... and /job/tag/... pages)
+            if not self._JOB_LINK_RE.search(link):
+                continue
+            
+            # Check if this is a URL we want to exclude
+            if self._excluded_re is not None and self._excluded_re.search(link):
+                log.debug("🚫 Excluding specific URL: %s", link)
+                continue
+            
+            filtered_links.append(link)
         
-        return filtered_links
+        # The map can list the same posting more than once; keep first-seen order
+        return list(dict.fromkeys(filtered_links))
     
     def crawl_jobscall_me(self) -> Optional[List[str]]:
         """Discover job links from the main job listing page."""
-        map_result = self.map_website(self.config.target_site_url)
-        if not map_result:
-            return None
+        site_url = self.config.target_site_url
+        all_links = None
+        if not self.config.force_rescrape:
+            all_links = self.scrape_cache.get_links(site_url, self.config.map_cache_ttl)
+            if all_links is not None:
+                print(f"💾 Using cached site map for {site_url} ({len(all_links)} links)")
+        
+        if all_links is None:
+            map_result = self.map_website(site_url)
+            if not map_result:
+                return None
+            all_links = self.extract_links(map_result)
+            if all_links:
+                self.scrape_cache.put_links(site_url, all_links)
         
-        all_links = self.extract_links(map_result)
         filtered_links = self.filter_job_links(all_links)
         
         print(f"\n📊 Discovery Summary:")
@@ -347,121 +901,180 @@ class JobscallMeCrawler:
         for i, link in enumerate(links, 1):
             print(f"{i:3d}. {link}")
     
-    def _extract_html_content(self, scrape_result) -> Optional[str]:
-        """Extract HTML content from Firecrawl scrape result."""
-        # Debug: Print the structure to understand the response format
-        if isinstance(scrape_result, dict):
-            print(f"🔍 Response keys: {list(scrape_result.keys())}")
-        
-        # Try different possible locations for HTML content
-        if isinstance(scrape_result, dict) and 'html' in scrape_result:
-            print(f"✅ Found html key in dict")
-            return scrape_result['html']
-        elif isinstance(scrape_result, dict) and 'content' in scrape_result:
-            print(f"✅ Found content key in dict")
-            return scrape_result['content']
-        elif isinstance(scrape_result, dict) and 'data' in scrape_result and isinstance(scrape_result['data'], dict):
-            data = scrape_result['data']
-            if 'html' in data:
-                print(f"✅ Found html in data object")
-                return data['html']
-            elif 'content' in data:
-                print(f"✅ Found content in data object")
-                return data['content']
-        elif hasattr(scrape_result, 'html') and scrape_result.html:
-            print(f"✅ Found html attribute with content")
-            return scrape_result.html
-        elif hasattr(scrape_result, 'raw_html') and scrape_result.raw_html:
-            print(f"✅ Found raw_html attribute with content")
-            return scrape_result.raw_html
-        else:
-            print(f"⚠️ No HTML content found")
-            if isinstance(scrape_result, dict):
-                print(f"🔍 Available keys: {list(scrape_result.keys())}")
-                # Print first few characters of each value to debug
-                for key, value in scrape_result.items():
-                    if isinstance(value, str) and len(value) > 50:
-                        print(f"🔍 {key}: {value[:100]}...")
-                    else:
-                        print(f"🔍 {key}: {value}")
-            return None
+    def _extract_html_content(self, scrape_result: Dict) -> Optional[str]:
+        """Extract page HTML from a /v1/scrape response ({"success": ..., "data": {"html": ...}}).
+        
+        Both HTTP clients return this shape (batch results are wrapped to match).
+        """
+        data = scrape_result.get('data')
+        html_content = data.get('html') if isinstance(data, dict) else None
+        if not html_content:
+            log.warning("⚠️ No HTML content found (response keys: %s)", list(scrape_result))
+        return html_content
     
-    def _should_stop_crawling(self, time_value: str, job_date: datetime.date) -> Tuple[bool, bool]:
+    def _should_stop_crawling(self, job_datetime: datetime.datetime, job_date: datetime.date) -> Tuple[bool, bool]:
         """Determine if crawling should stop and if job matches criteria."""
         if self.config.target_date is not None:
             matches = (job_date == self.config.target_date) if job_date else False
             if not matches:
-                print(f"⏭️  Skipping job not on target date {self.config.target_date} (found: {job_date})")
+                log.debug("⏭️  Skipping job not on target date %s (found: %s)", self.config.target_date, job_date)
             return False, matches  # Never stop early in target date mode
         else:
             # Check age cutoff
-            if DateUtils.is_job_too_old(time_value):
-                print(f"🛑 Job posting is older than cutoff (1 month) - stopping crawl")
+            if DateUtils.is_job_too_old(job_datetime, self.cutoff_date):
+                log.debug("🛑 Job posting is older than cutoff (1 month) - stopping crawl")
                 return True, False
             return False, True
     
-    async def scrape_job_page_async(self, executor, url: str) -> Optional[Dict]:
-        """Async wrapper around sync scraping - more reliable than direct HTTP."""
+    async def scrape_job_page_async(self, client: AsyncFirecrawlClient, url: str) -> Optional[Dict]:
+        """Scrape a job page through the shared async Firecrawl client."""
         try:
-            # Run the sync method in a thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(executor, self.scrape_job_page, url)
-            return result
+            cached_html = self._get_cached_html(url)
+            if cached_html:
+                return self._process_html(cached_html)
+            
+            log.debug("📄 Scraping job page: %s", url)
+            scrape_result = await client.scrape_async(url)
+            
+            if not scrape_result:
+                log.warning("⚠️ No content found for: %s", url)
+                return None
+            
+            return self._process_scrape_result(url, scrape_result)
         except Exception as e:
-            print(f"❌ Failed to scrape {url}: {str(e)}")
+            log.error("❌ Failed to scrape %s: %s", url, e)
             return None
     
+    async def scrape_batch_async(self, client: AsyncFirecrawlClient, urls: List[str]) -> Dict[str, Optional[Dict]]:
+        """Scrape uncached pages with one batch request; pages missing from it are retried singly."""
+        results = {}
+        pending = []
+        for url in urls:
+            cached_html = self._get_cached_html(url)
+            if cached_html:
+                results[url] = self._process_html(cached_html)
+            else:
+                pending.append(url)
+        
+        if pending:
+            print(f"📦 Batch scraping {len(pending)} job pages...")
+            batch_results = await client.batch_scrape_async(pending)
+            for url in pending:
+                scrape_result = batch_results.get(url)
+                if scrape_result:
+                    results[url] = self._process_scrape_result(url, scrape_result)
+                else:
+                    results[url] = await self.scrape_job_page_async(client, url)
+        
+        return results
+    
     def scrape_job_page(self, url: str) -> Optional[Dict]:
         """Synchronous wrapper for backward compatibility."""
+        import requests
+        
         try:
-            print(f"📄 Scraping job page: {url}")
-            scrape_result = self.firecrawl.scrape(url=url, formats=['html'])
+            cached_html = self._get_cached_html(url)
+            if cached_html:
+                return self._process_html(cached_html)
             
-            if not scrape_result:
-                print(f"⚠️ No content found for: {url}")
-                return None
+            log.debug("📄 Scraping job page: %s", url)
+            scrape_result = self.http_client.scrape(url)
             
-            html_content = self._extract_html_content(scrape_result)
-            if not html_content:
+            if not scrape_result:
+                log.warning("⚠️ No content found for: %s", url)
                 return None
             
-            # Process HTML content
-            processed_result = self.html_processor.extract_article_content(html_content)
-            
-            # Handle date logic if time value is found
-            if processed_result.get('time_value'):
-                try:
-                    parsed_dt = parser.parse(processed_result['time_value'])
-                    job_date = parsed_dt.date()
-                    processed_result['job_date'] = job_date.isoformat()
-                    
-                    stop_crawling, matches_criteria = self._should_stop_crawling(
-                        processed_result['time_value'], job_date
-                    )
-                    processed_result['stop_crawling'] = stop_crawling
-                    processed_result['matches_target_date'] = matches_criteria
-                except Exception:
-                    processed_result['stop_crawling'] = False
-                    processed_result['matches_target_date'] = self.config.target_date is None
-            else:
-                processed_result['stop_crawling'] = False
-                processed_result['matches_target_date'] = self.config.target_date is None
-            
-            return processed_result
+            return self._process_scrape_result(url, scrape_result)
             
-        except ConnectionError as e:
-            print(f"❌ Connection failed for {url}: {str(e)}")
-            print("ℹ️  Make sure your local Firecrawl instance is running")
+        except requests.ConnectionError as e:
+            log.error("❌ Connection failed for %s: %s", url, e)
+            log.error("ℹ️  Make sure your local Firecrawl instance is running")
             return None
         except Exception as e:
-            print(f"❌ Failed to scrape {url}: {str(e)}")
+            log.error("❌ Failed to scrape %s: %s", url, e)
             return None
     
+    def _get_cached_html(self, url: str) -> Optional[str]:
+        """Look up a previously scraped page unless a rescrape is forced."""
+        if self.config.force_rescrape:
+            return None
+        cached_html = self.scrape_cache.get(url)
+        if cached_html:
+            log.debug("💾 Using cached page: %s", url)
+        return cached_html
+    
+    def _process_scrape_result(self, url: str, scrape_result) -> Optional[Dict]:
+        """Cache the raw HTML of a scrape result and process it."""
+        html_content = self._extract_html_content(scrape_result)
+        if not html_content:
+            return None
+        
+        self.scrape_cache.put(url, html_content)
+        return self._process_html(html_content)
+    
+    def _process_html(self, html_content: str) -> Dict:
+        """Extract article content and date metadata from page HTML."""
+        # Process HTML content
+        processed_result = self.html_processor.extract_article_content(html_content)
+        
+        # Handle date logic with the timestamp extraction already parsed
+        job_datetime = processed_result.get('job_datetime')
+        if job_datetime is not None:
+            stop_crawling, matches_criteria = self._should_stop_crawling(job_datetime, job_datetime.date())
+            processed_result['stop_crawling'] = stop_crawling
+            processed_result['matches_target_date'] = matches_criteria
+        else:
+            processed_result['stop_crawling'] = False
+            processed_result['matches_target_date'] = self.config.target_date is None
+        
+        return processed_result
+    
+    
+    def _split_saved_jobs(self, jobs_to_scrape: List[str], html_dir: str, md_dir: str) -> Tuple[List[Dict], List[Tuple[int, str]]]:
+        """Separate jobs already saved in today's folder from the (index, url) pairs still to scrape.
+        
+        A job only gets saved after passing the date checks, so a rerun can
+        skip it without re-scraping.
+        """
+        saved_jobs = []
+        pending = []
+        for idx, job_url in enumerate(jobs_to_scrape):
+            file_info = None
+            if not self.config.force_rescrape:
+                file_info = self.file_manager.find_saved_job_files(job_url, html_dir, md_dir, idx)
+            if file_info:
+                saved_jobs.append({"url": job_url, **file_info, "already_saved": True})
+            else:
+                pending.append((idx, job_url))
+        
+        if saved_jobs:
+            print(f"⏭️  Skipping {len(saved_jobs)} jobs already saved today")
+        return saved_jobs, pending
+    
+    async def _probe_cutoff(self, client: AsyncFirecrawlClient, pending: List[Tuple[int, str]]) -> List[Tuple[int, str]]:
+        """Binary-search the first stale job and drop everything after it.
+        
+        Assumes the links are ordered newest first. Each probe is a normal
+        scrape, so probed pages land in the cache and the main pass reuses them.
+        """
+        lo, hi = 0, len(pending)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            result = await self.scrape_job_page_async(client, pending[mid][1])
+            if result and result.get('stop_crawling', False):
+                hi = mid
+            else:
+                lo = mid + 1
+        
+        print(f"🔎 Cutoff probe: {lo}/{len(pending)} jobs are within the last month")
+        if lo < len(pending):
+            print(f"🛑 Stopping crawl - encountered job older than 1 month")
+        return pending[:lo]
     
     async def scrape_all_jobs_async(self, job_links: List[str]) -> Tuple[List[Dict], str]:
-        """Async version using ThreadPoolExecutor - more reliable than direct HTTP."""
+        """Async version - all pages share one pooled HTTP session, scraped by a bounded worker pool."""
         scraped_jobs = []
-        jobs_to_scrape = job_links[:self.config.max_jobs]
+        jobs_to_scrape = list(dict.fromkeys(job_links))[:self.config.max_jobs]
         
         print(f"\n🚀 Starting ASYNC scrape of {len(jobs_to_scrape)} job pages...")
         
@@ -472,32 +1085,26 @@ class JobscallMeCrawler:
         # Create directory structure
         html_dir, md_dir, date_dir = self.file_manager.create_date_directories(date_folder)
         
-        total = len(jobs_to_scrape)
-        print(f"\n🚦 Processing {total} jobs with async concurrency={self.config.concurrency}...")
-        
-        # Create semaphore to limit concurrent requests
-        semaphore = asyncio.Semaphore(self.config.concurrency)
+        scraped_jobs, pending = self._split_saved_jobs(jobs_to_scrape, html_dir, md_dir)
         
-        async def scrape_with_semaphore(executor, url: str, index: int):
-            async with semaphore:
-                result = await self.scrape_job_page_async(executor, url)
-                if result:
-                    print(f"\n[{index+1}/{total}] ✅ Completed: {url}")
-                else:
-                    print(f"\n[{index+1}/{total}] ❌ Failed: {url}")
-                return url, result, index
+        total = len(jobs_to_scrape)
+        print(f"\n🚦 Processing {len(pending)} jobs with async concurrency={self.config.concurrency}...")
         
-        def save_result(job_url: str, result: Dict, index_hint: int):
+        async def save_result(job_url: str, result: Dict, index_hint: int):
             nonlocal scraped_jobs
             # If target date mode is active, skip saving non-matching jobs
             if self.config.target_date is not None and not result.get('matches_target_date', False):
                 return
             
             html_content = result['html_content']
-            markdown_content = self.html_processor.html_to_markdown(html_content)
+            # Pages without an <article> are full-page fallbacks; extraction only reads job Markdown
+            markdown_content = None
+            if result.get('article_found'):
+                markdown_content = self.html_processor.html_to_markdown(html_content, result.get('article_node'))
             
-            # Save files and get metadata
-            file_info = self.file_manager.save_job_files(
+            # Blocking file writes run in a thread so other scrapes keep going
+            file_info = await asyncio.to_thread(
+                self.file_manager.save_job_files,
                 job_url, html_content, markdown_content, html_dir, md_dir, index_hint
             )
             
@@ -515,41 +1122,85 @@ class JobscallMeCrawler:
                 job_info["job_date"] = result['job_date']
             
             scraped_jobs.append(job_info)
-            print(f"✅ Saved: {file_info['html_filename']} / {file_info['md_filename']}")
-        
-        # Use ThreadPoolExecutor for reliable sync method execution
-        with ThreadPoolExecutor(max_workers=self.config.concurrency) as executor:
-            # Create all tasks
-            tasks = [
-                scrape_with_semaphore(executor, url, idx) 
-                for idx, url in enumerate(jobs_to_scrape)
-            ]
-            
-            # Process results as they complete
-            should_stop = False
-            for coro in asyncio.as_completed(tasks):
-                if should_stop:
-                    break
-                    
-                try:
-                    job_url, result, idx = await coro
-                    
-                    if result and isinstance(result, dict) and result.get('html_content'):
-                        # Early stop only when not in target-date mode
-                        if result.get('stop_crawling', False) and self.config.target_date is None:
-                            print(f"🛑 Stopping crawl - encountered job older than 1 month")
-                            should_stop = True
-                            # Cancel remaining tasks
-                            for task in tasks:
-                                if not task.done():
-                                    task.cancel()
+            summary_log.write(job_info)
+            log.info("[%d/%d] ✅ Saved: %s -> %s / %s", index_hint + 1, total, job_url,
+                     file_info['html_filename'], file_info['md_filename'])
+        
+        with self.file_manager.open_summary_log(date_dir, scraped_jobs) as summary_log:
+            # One client (and connection pool) is shared by every scrape in this crawl
+            async with AsyncFirecrawlClient(self.config.base_url) as client:
+                if self.config.probe_cutoff and self.config.target_date is None and pending:
+                    pending = await self._probe_cutoff(client, pending)
+                
+                if self.config.batch_scrape:
+                    # Submit fixed-size chunks in source order, so a stale job
+                    # stops the crawl before later chunks are ever requested
+                    job_iter = iter(pending)
+                    stop = False
+                    while not stop:
+                        chunk = list(itertools.islice(job_iter, self.config.batch_size))
+                        if not chunk:
                             break
+                        results = await self.scrape_batch_async(client, [job_url for _, job_url in chunk])
                         
-                        save_result(job_url, result, idx)
-                        
-                except Exception as e:
-                    print(f"❌ Error processing result: {e}")
-                    continue
+                        for idx, job_url in chunk:
+                            result = results.get(job_url)
+                            if not (result and result.get('html_content')):
+                                log.info("[%d/%d] ❌ Failed: %s", idx + 1, total, job_url)
+                                continue
+                            
+                            # Early stop only when not in target-date mode
+                            if result.get('stop_crawling', False) and self.config.target_date is None:
+                                print(f"🛑 Stopping crawl - encountered job older than 1 month")
+                                stop = True
+                                break
+                            
+                            await save_result(job_url, result, idx)
+                else:
+                    # A fixed pool of workers pulls URLs from a queue, so at most
+                    # `concurrency` pages are in flight (and in memory) at once
+                    queue = asyncio.Queue()
+                    for job in pending:
+                        queue.put_nowait(job)
+                    # Index of the earliest stale job seen; jobs before it are still saved
+                    stop_index = None
+                    
+                    async def worker():
+                        nonlocal stop_index
+                        while stop_index is None:
+                            try:
+                                idx, job_url = queue.get_nowait()
+                            except asyncio.QueueEmpty:
+                                return
+                            
+                            try:
+                                result = await self.scrape_job_page_async(client, job_url)
+                                # Only jobs after the stale one are dropped; the queue is in
+                                # source order, so nothing this worker pulls next is kept either
+                                if stop_index is not None and idx > stop_index:
+                                    return
+                                
+                                if not (result and isinstance(result, dict) and result.get('html_content')):
+                                    log.info("[%d/%d] ❌ Failed: %s", idx + 1, total, job_url)
+                                    continue
+                                
+                                # Early stop only when not in target-date mode
+                                if result.get('stop_crawling', False) and self.config.target_date is None:
+                                    if stop_index is None:
+                                        print(f"🛑 Stopping crawl - encountered job older than 1 month")
+                                        stop_index = idx
+                                    else:
+                                        stop_index = min(stop_index, idx)
+                                    return
+                                
+                                await save_result(job_url, result, idx)
+                            except Exception as e:
+                                log.error("❌ Error processing result for %s: %s", job_url, e)
+                    
+                    workers = [asyncio.create_task(worker()) for _ in range(min(self.config.concurrency, len(pending)))]
+                    await asyncio.gather(*workers)
+        
+        self.scrape_cache.save()
         
         print(f"\n📊 Async Scraping Summary:")
         print(f"   Successfully scraped: {len(scraped_jobs)}/{len(jobs_to_scrape)} jobs")
@@ -558,13 +1209,17 @@ class JobscallMeCrawler:
     
     def scrape_all_jobs(self, job_links: List[str]) -> Tuple[List[Dict], str]:
         """Main scraping method - uses async for better performance."""
-        # Run the async version
-        return asyncio.run(self.scrape_all_jobs_async(job_links))
+        # Run the async version, on uvloop's faster event loop when it is installed
+        try:
+            import uvloop
+        except ImportError:  # optional; not available on Windows
+            return asyncio.run(self.scrape_all_jobs_async(job_links))
+        return uvloop.run(self.scrape_all_jobs_async(job_links))
     
     def scrape_all_jobs_sync(self, job_links: List[str]) -> Tuple[List[Dict], str]:
         """Synchronous fallback version (slower but more compatible)."""
         scraped_jobs = []
-        jobs_to_scrape = job_links[:self.config.max_jobs]
+        jobs_to_scrape = list(dict.fromkeys(job_links))[:self.config.max_jobs]
         
         print(f"\n🔍 Starting SYNC scrape of {len(jobs_to_scrape)} job pages...")
         
@@ -575,9 +1230,10 @@ class JobscallMeCrawler:
         # Create directory structure
         html_dir, md_dir, date_dir = self.file_manager.create_date_directories(date_folder)
         
+        scraped_jobs, pending = self._split_saved_jobs(jobs_to_scrape, html_dir, md_dir)
+        
         total = len(jobs_to_scrape)
-        print(f"\n🚦 Submitting {total} jobs with concurrency={self.config.concurrency}...")
-        processed = 0
+        print(f"\n🚦 Submitting {len(pending)} jobs with concurrency={self.config.concurrency}...")
         
         def save_result(job_url: str, result: Dict, index_hint: int):
             nonlocal scraped_jobs
@@ -586,7 +1242,10 @@ class JobscallMeCrawler:
                 return
             
             html_content = result['html_content']
-            markdown_content = self.html_processor.html_to_markdown(html_content)
+            # Pages without an <article> are full-page fallbacks; extraction only reads job Markdown
+            markdown_content = None
+            if result.get('article_found'):
+                markdown_content = self.html_processor.html_to_markdown(html_content, result.get('article_node'))
             
             # Save files and get metadata
             file_info = self.file_manager.save_job_files(
@@ -607,19 +1266,20 @@ class JobscallMeCrawler:
                 job_info["job_date"] = result['job_date']
             
             scraped_jobs.append(job_info)
-            print(f"✅ Saved: {file_info['html_filename']} / {file_info['md_filename']}")
+            summary_log.write(job_info)
+            log.info("[%d/%d] ✅ Saved: %s -> %s / %s", index_hint + 1, total, job_url,
+                     file_info['html_filename'], file_info['md_filename'])
         
-        with ThreadPoolExecutor(max_workers=self.config.concurrency) as executor:
-            future_to_url = {executor.submit(self.scrape_job_page, url): url for url in jobs_to_scrape}
-            for idx, future in enumerate(as_completed(future_to_url), 1):
-                job_url = future_to_url[future]
+        with ThreadPoolExecutor(max_workers=self.config.concurrency) as executor, \
+                self.file_manager.open_summary_log(date_dir, scraped_jobs) as summary_log:
+            future_to_url = {executor.submit(self.scrape_job_page, url): (idx, url) for idx, url in pending}
+            for future in as_completed(future_to_url):
+                idx, job_url = future_to_url[future]
                 try:
                     result = future.result()
                 except Exception as e:
-                    print(f"❌ Error scraping {job_url}: {e}")
+                    log.info("[%d/%d] ❌ Error scraping %s: %s", idx + 1, total, job_url, e)
                     continue
-                processed += 1
-                print(f"\n[{processed}/{total}] Completed: {job_url}")
                 
                 if result and isinstance(result, dict) and result.get('html_content'):
                     # Early stop only when not in target-date mode
@@ -633,7 +1293,9 @@ class JobscallMeCrawler:
                     
                     save_result(job_url, result, idx)
                 else:
-                    print(f"❌ Failed to extract HTML content from: {job_url}")
+                    log.info("[%d/%d] ❌ Failed to extract HTML content from: %s", idx + 1, total, job_url)
+        
+        self.scrape_cache.save()
         
         print(f"\n📊 Scraping Summary:")
         print(f"   Successfully scraped: {len(scraped_jobs)}/{len(jobs_to_scrape)} jobs")
@@ -648,6 +1310,24 @@ class JobscallMeCrawler:
         self.file_manager.save_results_summary(links, scraped_jobs or [], date_folder)
 
 
+def get_default_concurrency() -> int:
+    """Read the default scrape concurrency from the environment."""
+    try:
+        return int(os.getenv('FIRECRAWL_CONCURRENCY', '8'))
+    except ValueError:
+        print("⚠️  Invalid FIRECRAWL_CONCURRENCY, using 8")
+        return 8
+
+
+def get_batch_size() -> int:
+    """Read the number of URLs per batch scrape request from the environment."""
+    try:
+        return int(os.getenv('FIRECRAWL_BATCH_SIZE', '50'))
+    except ValueError:
+        print("⚠️  Invalid FIRECRAWL_BATCH_SIZE, using 50")
+        return 50
+
+
 def get_base_url() -> str:
     base_url = os.getenv('FIRECRAWL_BASE_URL', 'http://localhost:3002')
     
@@ -672,18 +1352,75 @@ def main():
     parser_obj.add_argument(
         "--concurrency",
         type=int,
-        default=5,
-        help="Number of concurrent workers for scraping (default: 5). Increase to speed up scraping; be mindful of server limits."
+        default=get_default_concurrency(),
+        help="Number of concurrent workers for scraping (default: $FIRECRAWL_CONCURRENCY or 8). Increase to speed up scraping; be mindful of server limits."
+    )
+    parser_obj.add_argument(
+        "--mode",
+        choices=["map", "scrape"],
+        default="scrape",
+        help="'map' only discovers and saves job links; 'scrape' also scrapes each job page (default: scrape)."
+    )
+    parser_obj.add_argument(
+        "--max-jobs",
+        type=int,
+        default=500,
+        help="Maximum number of job pages to scrape (default: 500)."
+    )
+    parser_obj.add_argument(
+        "--force-rescrape",
+        action="store_true",
+        help="Ignore the local page and site-map caches; map the site and scrape every job page again."
+    )
+    parser_obj.add_argument(
+        "--batch-scrape",
+        action="store_true",
+        help="Submit job pages to Firecrawl's batch scrape endpoint instead of one request per page "
+             "(FIRECRAWL_BATCH_SIZE pages per batch, default: 50)."
+    )
+    parser_obj.add_argument(
+        "--pretty-json",
+        action="store_true",
+        help="Indent the links/summary JSON files for human reading (default: compact)."
+    )
+    parser_obj.add_argument(
+        "--markdown-backend",
+        choices=HtmlProcessor.MARKDOWN_BACKENDS,
+        default="lxml",
+        help="Markdown converter: 'lxml' serializes the already-parsed article directly; 'html2text' is the older, slower converter (default: lxml)."
+    )
+    parser_obj.add_argument(
+        "--probe-cutoff",
+        action="store_true",
+        help="Binary-search the one-month cutoff before scraping, assuming links are listed newest first."
+    )
+    parser_obj.add_argument(
+        "--compress-html",
+        action="store_true",
+        help="Save job HTML zstd-compressed as .html.zst (requires the zstandard package)."
     )
     args = parser_obj.parse_args()
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # FIRECRAWL_DEBUG=1 turns on the crawler's per-step trace (library loggers stay at INFO)
+    if os.getenv('FIRECRAWL_DEBUG'):
+        log.setLevel(logging.DEBUG)
+    
     base_url = get_base_url()
     
     # Create configuration
     config = CrawlerConfig(
         base_url=base_url,
         target_date=DateUtils.parse_target_date(args.target_date),
-        concurrency=args.concurrency
+        concurrency=args.concurrency,
+        max_jobs=args.max_jobs,
+        force_rescrape=args.force_rescrape,
+        batch_scrape=args.batch_scrape,
+        batch_size=get_batch_size(),
+        pretty_json=args.pretty_json,
+        markdown_backend=args.markdown_backend,
+        probe_cutoff=args.probe_cutoff,
+        compress_html=args.compress_html
     )
     
     # Initialize crawler
@@ -706,6 +1443,11 @@ def main():
     
     crawler.display_results(links)
     
+    if args.mode == "map":
+        crawler.save_results(links)
+        print(f"\n✅ Mapping completed: {len(links)} job links discovered")
+        return
+    
     # Step 2: Scrape individual job pages
     print("\n🚀 Step 2: Scraping individual job pages...")
     scraped_jobs, date_folder = crawler.scrape_all_jobs(links)
@@ -2,13 +2,16 @@ import os
 import argparse
 import asyncio
 import aiofiles
+import httpx
 from google import genai
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+from pydantic.json_schema import SkipJsonSchema
 from typing import Optional
-import json
+import hashlib
 from datetime import datetime
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 import time
 
 # Define the structured output model for a single job
@@ -18,203 +21,526 @@ class JobData(BaseModel):
     post_date: str
     job_description: Optional[str]
     job_requirement: Optional[str]
-    job_url: str
-    source: str
+    # Filled in after extraction; left out of the schema sent to Gemini
+    job_url: SkipJsonSchema[str] = ""
+    source: SkipJsonSchema[str] = ""
 
 # Define the structured output model for multiple jobs
 class JobsExtraction(BaseModel):
     jobs: list[JobData]
     total_jobs: int
 
-async def extract_job_data_async(markdown_file_path: str, api_key: str, save_json: bool = True) -> JobsExtraction:
+# Define the structured output model for several markdown files sent in one request
+class FileJobsExtraction(BaseModel):
+    file_id: str
+    jobs: list[JobData]
+    total_jobs: int
+
+class BatchJobsExtraction(BaseModel):
+    results: list[FileJobsExtraction]
+
+# JSON schemas sent as response_schema, generated once instead of per request
+JOBS_RESPONSE_SCHEMA = JobsExtraction.model_json_schema()
+BATCH_RESPONSE_SCHEMA = BatchJobsExtraction.model_json_schema()
+
+# Static extraction instructions, sent as the system instruction so every request
+# shares an identical prefix and only the markdown content varies
+FIELD_INSTRUCTIONS = """For each job found, extract:
+- job_title: The main job title (include both English and Chinese if available)
+- company_name: The company name
+- post_date: The posting date in YYYY-MM-DD format
+- job_description: The job description section (if available)
+- job_requirement: All requirements listed for the job (preserve formatting with bullet points)"""
+
+STATIC_INSTRUCTIONS = f"""Extract job information from the markdown content provided by the user. The content may contain multiple job postings.
+
+{FIELD_INSTRUCTIONS}
+
+Return a list of all jobs found in the document. If there's only one job, return a list with one item.
+Set total_jobs to the number of jobs found."""
+
+BATCH_STATIC_INSTRUCTIONS = f"""Extract job information from the markdown files provided by the user. Each file starts with a line
+"--- FILE: <file_id> ---" and may contain multiple job postings.
+
+{FIELD_INSTRUCTIONS}
+
+Return one result per file, with file_id set to the exact file_id from its delimiter line.
+Set total_jobs of each result to the number of jobs found in that file."""
+
+# Default model; also the fallback when another model's output fails schema validation
+GEMINI_MODEL = "gemini-2.5-flash"
+
+# Bump whenever JobData/JobsExtraction change so stale cached responses are ignored
+EXTRACTION_SCHEMA_VERSION = 2
+
+# Cached Gemini responses, keyed by markdown content hash
+EXTRACTION_CACHE_DIR = Path("firecrawl/job-data/cache/extract")
+
+# Keep-alive connection pool shared by every request made through one client
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+
+# Retry rate-limited (429) and transient server errors with exponential backoff and jitter
+RETRY_OPTIONS = {
+    "attempts": 6,
+    "initial_delay": 2.0,
+    "max_delay": 60.0,
+    "http_status_codes": [429, 500, 502, 503, 504],
+}
+
+# One Gemini client per API key, reused across files
+_CLIENTS: dict[str, genai.Client] = {}
+
+def get_client(api_key: str) -> genai.Client:
+    """Return the shared Gemini client for an API key, creating it on first use."""
+    client = _CLIENTS.get(api_key)
+    if client is None:
+        client = genai.Client(
+            api_key=api_key,
+            http_options={
+                "client_args": {"limits": HTTP_LIMITS},
+                "async_client_args": {"limits": HTTP_LIMITS},
+                "retry_options": RETRY_OPTIONS,
+            },
+        )
+        _CLIENTS[api_key] = client
+    return client
+
+class RateLimiter:
+    """Spaces API calls evenly so a run stays under a requests-per-minute quota."""
+    
+    def __init__(self, requests_per_minute: int):
+        self.interval = 60.0 / requests_per_minute
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until the next request slot is free."""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+def extraction_cache_key(markdown_content: str, model: str = GEMINI_MODEL) -> str:
+    """Hash the markdown together with everything else that shapes the response."""
+    digest = hashlib.sha256()
+    digest.update(f"{model}\0{EXTRACTION_SCHEMA_VERSION}\0".encode())
+    digest.update(STATIC_INSTRUCTIONS.encode('utf-8'))
+    digest.update(b"\0")
+    digest.update(markdown_content.encode('utf-8'))
+    return digest.hexdigest()
+
+def extraction_cache_path(key: str) -> Path:
+    """Location of a cached response, sharded by the first two hex digits."""
+    return EXTRACTION_CACHE_DIR / key[:2] / f"{key}.json"
+
+async def load_cached_extraction(key: str) -> Optional[JobsExtraction]:
+    """Return the cached extraction for a content hash, or None on a miss."""
+    try:
+        async with aiofiles.open(extraction_cache_path(key), 'r', encoding='utf-8') as f:
+            data = await f.read()
+        return JobsExtraction.model_validate_json(data)
+    except (OSError, ValueError):
+        return None
+
+async def save_cached_extraction(key: str, jobs_data: JobsExtraction) -> None:
+    """Store a raw Gemini extraction (before job_url/source are filled in)."""
+    path = extraction_cache_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    async with aiofiles.open(path, 'w', encoding='utf-8') as f:
+        await f.write(jobs_data.model_dump_json())
+
+def list_markdown_files(markdown_dir: str) -> list[Path]:
+    """List the *.md files in a directory with a single scandir pass."""
+    with os.scandir(markdown_dir) as entries:
+        return [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith('.md') and not entry.name.startswith('.') and entry.is_file(follow_symlinks=False)
+        ]
+
+def build_generation_config(model: str, system_instruction: str, response_schema: dict) -> dict:
+    """Deterministic structured-output config for one extraction request."""
+    config = {
+        "system_instruction": system_instruction,
+        "response_mime_type": "application/json",
+        "response_schema": response_schema,
+        "temperature": 0.0,
+    }
+    # Extraction needs no reasoning tokens; Pro models cannot turn thinking off
+    if "-pro" not in model:
+        config["thinking_config"] = {"thinking_budget": 0}
+    return config
+
+async def generate_extraction(client: genai.Client, model: str, contents: str, system_instruction: str,
+                              response_schema: dict, result_type: type[BaseModel],
+                              limiter: Optional[RateLimiter] = None) -> BaseModel:
+    """
+    Run one structured Gemini request and validate the JSON it returns.
+    
+    If a model other than GEMINI_MODEL returns JSON that does not match the schema,
+    the request is retried once on GEMINI_MODEL.
+    """
+    for attempt_model in dict.fromkeys((model, GEMINI_MODEL)):
+        if limiter is not None:
+            await limiter.acquire()
+        
+        # Generate structured response with the SDK's native async API
+        response = await client.aio.models.generate_content(
+            model=attempt_model,
+            contents=contents,
+            config=build_generation_config(attempt_model, system_instruction, response_schema),
+        )
+        
+        # Parse and validate the response JSON
+        try:
+            return result_type.model_validate_json(response.text)
+        except ValidationError as e:
+            if attempt_model == GEMINI_MODEL:
+                raise
+            print(f"⚠️  {attempt_model} returned invalid JSON ({e.error_count()} error(s)), retrying with {GEMINI_MODEL}")
+
+async def read_markdown_async(path: Path) -> str:
+    """Read a markdown file asynchronously."""
+    async with aiofiles.open(path, 'r', encoding='utf-8') as file:
+        return await file.read()
+
+def fill_job_metadata(jobs_data: JobsExtraction, md_filename: str) -> JobsExtraction:
+    """Populate the job_url and source fields the model leaves empty."""
+    for job in jobs_data.jobs:
+        job.job_url = f"https://www.jobscall.me/job/{md_filename}"
+        job.source = "jobscallme"
+    return jobs_data
+
+async def extract_job_data_async(markdown_file_path: str, api_key: str, save_json: bool = True, today: Optional[str] = None, limiter: Optional[RateLimiter] = None, markdown_content: Optional[str] = None, model: str = GEMINI_MODEL, keep_aggregate: bool = False) -> JobsExtraction:
     """
     Extract structured job data from markdown file using Gemini API
     
     Args:
         markdown_file_path: Path to the markdown file containing job posting(s)
         api_key: Gemini API key
-        save_json: Whether to save the extracted data as JSON file (default: True)
+        save_json: Whether to save the extracted data as JSON files (default: True)
+        today: Output date folder in YYYYMMDD format (default: today)
+        limiter: Optional rate limiter applied before the API call
+        markdown_content: Already-read file content; the file is read when omitted
+        model: Gemini model to use (default: gemini-2.5-flash)
+        keep_aggregate: Also save the whole extraction to json/ (default: False)
         
     Returns:
         JobsExtraction: Structured job data containing list of jobs
     """
     # Read the markdown file asynchronously
-    async with aiofiles.open(markdown_file_path, 'r', encoding='utf-8') as file:
-        markdown_content = await file.read()
-    
-    # Initialize Gemini client
-    client = genai.Client(api_key=api_key)
+    if markdown_content is None:
+        markdown_content = await read_markdown_async(Path(markdown_file_path))
     
-    # Create the prompt for extraction
-    prompt = f"""
-    Extract job information from the following markdown content. The content may contain multiple job postings.
+    # Reuse a previous response for identical markdown
+    cache_key = extraction_cache_key(markdown_content, model)
+    jobs_data = await load_cached_extraction(cache_key)
     
-    For each job found, extract:
-    - job_title: The main job title (include both English and Chinese if available)
-    - company_name: The company name
-    - post_date: The posting date in YYYY-MM-DD format
-    - job_description: The job description section (if available)
-    - job_requirement: All requirements listed for the job (preserve formatting with bullet points)
-    - job_url: Leave empty (will be populated automatically)
-    - source: Leave empty (will be populated automatically)
-    
-    Return a list of all jobs found in the document. If there's only one job, return a list with one item.
-    Set total_jobs to the number of jobs found.
-    
-    Note: The job_url and source fields will be automatically populated after extraction.
-    
-    Markdown content:
-    {markdown_content}
-    """
-    
-    # Generate structured response (run in thread pool to avoid blocking)
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor() as executor:
-        response = await loop.run_in_executor(
-            executor,
-            lambda: client.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=prompt,
-                config={
-                    "response_mime_type": "application/json",
-                    "response_schema": JobsExtraction,
-                },
-            )
-        )
-    
-    # Parse the response
-    jobs_data: JobsExtraction = response.parsed
-    
-    # Get the markdown filename for URL generation
-    md_filename = Path(markdown_file_path).stem
+    if jobs_data is None:
+        # Reuse the shared Gemini client
+        jobs_data = await generate_extraction(
+            get_client(api_key), model, markdown_content,
+            STATIC_INSTRUCTIONS, JOBS_RESPONSE_SCHEMA, JobsExtraction, limiter)
+        await save_cached_extraction(cache_key, jobs_data)
     
     # Update each job with the URL and source
-    for job in jobs_data.jobs:
-        job.job_url = f"https://www.jobscall.me/job/{md_filename}"
-        job.source = "jobscallme"
+    fill_job_metadata(jobs_data, Path(markdown_file_path).stem)
     
     # Save as JSON if requested
     if save_json:
-        await save_job_data_as_json_async(jobs_data, markdown_file_path)
+        await save_job_data_as_json_async(jobs_data, markdown_file_path, today, keep_aggregate=keep_aggregate)
     
     return jobs_data
 
-async def save_job_data_as_json_async(jobs_data: JobsExtraction, markdown_file_path: str) -> str:
+async def extract_job_data_batch_async(markdown_files: list[Path], api_key: str, save_json: bool = True, today: Optional[str] = None, limiter: Optional[RateLimiter] = None, markdown_contents: Optional[list[str]] = None, model: str = GEMINI_MODEL, keep_aggregate: bool = False) -> dict[str, JobsExtraction]:
     """
-    Save job data as JSON file in the specified directory structure (async)
+    Extract structured job data from several markdown files with a single Gemini request
     
     Args:
-        jobs_data: The extracted jobs data
-        markdown_file_path: Original markdown file path
+        markdown_files: Paths to the markdown files to send together
+        api_key: Gemini API key
+        save_json: Whether to save the extracted data as JSON files (default: True)
+        today: Output date folder in YYYYMMDD format (default: today)
+        limiter: Optional rate limiter applied before the API call
+        markdown_contents: Already-read file contents; the files are read when omitted
+        model: Gemini model to use (default: gemini-2.5-flash)
+        keep_aggregate: Also save each whole extraction to json/ (default: False)
         
     Returns:
-        str: Path to the saved JSON file
+        dict[str, JobsExtraction]: Extracted jobs keyed by markdown file stem
     """
-    # Get today's date in YYYYMMDD format
-    today = datetime.now().strftime("%Y%m%d")
+    # Read all markdown files concurrently
+    contents = markdown_contents
+    if contents is None:
+        contents = await asyncio.gather(*(read_markdown_async(path) for path in markdown_files))
+    
+    # Serve files with a cached response locally; only the rest go to Gemini
+    cache_keys = {path.stem: extraction_cache_key(content, model) for path, content in zip(markdown_files, contents)}
+    cached = await asyncio.gather(*(load_cached_extraction(cache_keys[path.stem]) for path in markdown_files))
+    results: dict[str, JobsExtraction] = {
+        path.stem: jobs_data for path, jobs_data in zip(markdown_files, cached) if jobs_data is not None
+    }
+    pending = [(path, content) for path, content in zip(markdown_files, contents) if path.stem not in results]
+    
+    if pending:
+        # Concatenate the files with delimiters so the model can tell them apart
+        sections = "\n\n".join(f"--- FILE: {path.stem} ---\n{content}" for path, content in pending)
+        
+        # Reuse the shared Gemini client
+        batch_data = await generate_extraction(
+            get_client(api_key), model, sections,
+            BATCH_STATIC_INSTRUCTIONS, BATCH_RESPONSE_SCHEMA, BatchJobsExtraction, limiter)
+        
+        # Split the results back out per file, ignoring ids the model made up
+        pending_stems = {path.stem for path, _ in pending}
+        fresh: dict[str, JobsExtraction] = {}
+        for result in batch_data.results:
+            if result.file_id in pending_stems:
+                fresh[result.file_id] = JobsExtraction(jobs=result.jobs, total_jobs=result.total_jobs)
+        await asyncio.gather(*(save_cached_extraction(cache_keys[stem], jobs_data) for stem, jobs_data in fresh.items()))
+        results.update(fresh)
     
-    # Get the filename without extension from the markdown file
-    md_filename = Path(markdown_file_path).stem
+    # Update each job with the URL and source
+    for stem, jobs_data in results.items():
+        fill_job_metadata(jobs_data, stem)
+    
+    # Save as JSON if requested
+    if save_json:
+        paths_by_stem = {path.stem: path for path in markdown_files}
+        await asyncio.gather(*(
+            save_job_data_as_json_async(jobs_data, str(paths_by_stem[stem]), today, keep_aggregate=keep_aggregate)
+            for stem, jobs_data in results.items()
+        ))
     
-    # Create the output directory structure (with new folder structure: job-data/{YYYYMMDD}/jobscallme/)
+    return results
+
+@lru_cache(maxsize=None)
+def json_output_dir(today: str) -> Path:
+    """Return (and create once) the aggregate JSON output directory for a YYYYMMDD date."""
+    # New folder structure: job-data/{YYYYMMDD}/jobscallme/json
     output_dir = Path("firecrawl/job-data") / today / "jobscallme" / "json"
     output_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Create the output file path
-    json_filename = f"{md_filename}.json"
-    output_path = output_dir / json_filename
-    
-    # Save the JSON data asynchronously
-    async with aiofiles.open(output_path, 'w', encoding='utf-8') as f:
-        await f.write(json.dumps(jobs_data.model_dump(), indent=2, ensure_ascii=False))
-    
-    print(f"✅ JSON saved to: {output_path}")
-    return str(output_path)
+    return output_dir
 
-def save_job_data_as_json(jobs_data: JobsExtraction, markdown_file_path: str) -> str:
+@lru_cache(maxsize=None)
+def final_output_dir(today: str) -> Path:
+    """Return (and create once) the per-job JSON output directory for a YYYYMMDD date."""
+    output_dir = Path("firecrawl/job-data") / today / "jobscallme" / "final"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir
+
+def saved_job_mtimes(today: str) -> dict[str, int]:
     """
-    Synchronous wrapper for save_job_data_as_json_async
+    Map each markdown stem with saved final/{stem}-NNN.json files to their newest mtime.
+    
+    One scandir of the final directory; used to skip pages processed by an earlier run.
     """
-    return asyncio.run(save_job_data_as_json_async(jobs_data, markdown_file_path))
+    final_dir = Path("firecrawl/job-data") / today / "jobscallme" / "final"
+    mtimes: dict[str, int] = {}
+    try:
+        with os.scandir(final_dir) as entries:
+            for entry in entries:
+                stem, sep, number = entry.name.removesuffix('.json').rpartition('-')
+                if not sep or not number.isdigit() or not entry.name.endswith('.json'):
+                    continue
+                mtime = entry.stat().st_mtime_ns
+                if mtime > mtimes.get(stem, 0):
+                    mtimes[stem] = mtime
+    except FileNotFoundError:
+        pass
+    return mtimes
 
-# Synchronous wrapper for extract_job_data_async  
-def extract_job_data(markdown_file_path: str, api_key: str, save_json: bool = True) -> JobsExtraction:
+async def save_job_data_as_json_async(jobs_data: JobsExtraction, markdown_file_path: str, today: Optional[str] = None,
+                                      save_individual: bool = True, keep_aggregate: bool = False) -> list[str]:
     """
-    Synchronous wrapper for extract_job_data_async
+    Save job data as JSON files in the specified directory structure (async)
+    
+    Each job is written to final/{name}-NNN.json directly, so populate_json.py no
+    longer has to re-read an aggregate file to split it.
+    
+    Args:
+        jobs_data: The extracted jobs data
+        markdown_file_path: Original markdown file path
+        today: Output date folder in YYYYMMDD format (default: today)
+        save_individual: Write one final/{name}-NNN.json file per job (default: True)
+        keep_aggregate: Also write the whole extraction to json/{name}.json (default: False)
+        
+    Returns:
+        list[str]: Paths of the saved JSON files
     """
-    return asyncio.run(extract_job_data_async(markdown_file_path, api_key, save_json))
+    # Get the filename without extension from the markdown file
+    md_filename = Path(markdown_file_path).stem
+    today = today or datetime.now().strftime("%Y%m%d")
+    
+    async def write(path: Path, data: str) -> str:
+        async with aiofiles.open(path, 'w', encoding='utf-8') as f:
+            await f.write(data)
+        return str(path)
+    
+    writes = []
+    if keep_aggregate:
+        writes.append(write(json_output_dir(today) / f"{md_filename}.json", jobs_data.model_dump_json(indent=2)))
+    if save_individual:
+        final_dir = final_output_dir(today)
+        writes.extend(
+            write(final_dir / f"{md_filename}-{i:03d}.json", job.model_dump_json(indent=2))
+            for i, job in enumerate(jobs_data.jobs, 1)
+        )
+    
+    # Save the JSON files concurrently
+    saved_paths = await asyncio.gather(*writes)
+    
+    print(f"✅ JSON saved for {md_filename}: {len(saved_paths)} file(s)")
+    return saved_paths
 
-async def process_multiple_files_async(markdown_dir: str, api_key: str, max_concurrent: int = 5) -> list[str]:
+async def process_multiple_files_async(markdown_dir: str, api_key: str, max_concurrent: int = 20, batch_size: int = 1, today: Optional[str] = None, requests_per_minute: int = 0, model: str = GEMINI_MODEL, keep_aggregate: bool = False, force: bool = False) -> list[str]:
     """
     Process multiple markdown files from a directory in parallel
     
     Args:
         markdown_dir: Directory containing markdown files
         api_key: Gemini API key
-        max_concurrent: Maximum number of concurrent API calls (default: 5)
+        max_concurrent: Maximum number of concurrent API calls (default: 20)
+        batch_size: Number of markdown files sent per API call (default: 1)
+        today: Output date folder in YYYYMMDD format (default: today)
+        requests_per_minute: Cap on API calls per minute, 0 for no cap (default: 0)
+        model: Gemini model to use (default: gemini-2.5-flash)
+        keep_aggregate: Also save each whole extraction to json/ (default: False)
+        force: Reprocess files whose output is already newer than the markdown (default: False)
         
     Returns:
         list[str]: List of JSON file paths that were created
     """
-    markdown_path = Path(markdown_dir)
-    if not markdown_path.exists():
+    if not os.path.isdir(markdown_dir):
         raise ValueError(f"Directory not found: {markdown_dir}")
     
     json_files = []
-    md_files = list(markdown_path.glob("*.md"))
+    md_files = list_markdown_files(markdown_dir)
     
     if not md_files:
         print(f"⚠️  No markdown files found in {markdown_dir}")
         return json_files
     
-    print(f"🚀 Processing {len(md_files)} markdown files in parallel (max {max_concurrent} concurrent)...")
+    # Resolve the output date once for the whole run
+    today = today or datetime.now().strftime("%Y%m%d")
+    
+    # Skip pages whose job files were written after the markdown last changed
+    if not force:
+        saved_mtimes = saved_job_mtimes(today)
+        pending_files = [
+            md_file for md_file in md_files
+            if md_file.stem not in saved_mtimes or md_file.stat().st_mtime_ns >= saved_mtimes[md_file.stem]
+        ]
+        if len(pending_files) < len(md_files):
+            print(f"⏭️  Skipping {len(md_files) - len(pending_files)} already processed file(s) (use --force to redo them)")
+        md_files = pending_files
+        if not md_files:
+            print("✅ Nothing to do, every markdown file is already processed")
+            return json_files
+    
+    batch_size = max(1, batch_size)
+    print(f"🚀 Processing {len(md_files)} markdown files in parallel (max {max_concurrent} concurrent, {batch_size} per request)...")
     start_time = time.time()
     
-    # Create semaphore to limit concurrent requests
+    # Read every file up front and group identical content, so each distinct
+    # page goes to Gemini once and its duplicates reuse the result
+    contents = await asyncio.gather(*(read_markdown_async(md_file) for md_file in md_files))
+    groups: dict[str, list[Path]] = {}
+    unique_files: list[tuple[Path, str]] = []
+    for md_file, content in zip(md_files, contents):
+        group = groups.setdefault(extraction_cache_key(content, model), [])
+        if not group:
+            unique_files.append((md_file, content))
+        group.append(md_file)
+    # Every file sharing a distinct file's content, keyed by the distinct file
+    same_content_as = {group[0]: group for group in groups.values()}
+    
+    if len(unique_files) < len(md_files):
+        print(f"♻️  {len(md_files) - len(unique_files)} duplicate file(s) will reuse another file's extraction")
+    
+    # Create semaphore to limit concurrent requests, plus an optional per-minute quota
     semaphore = asyncio.Semaphore(max_concurrent)
+    limiter = RateLimiter(requests_per_minute) if requests_per_minute > 0 else None
     
-    async def process_single_file(md_file: Path) -> tuple[str, bool, str]:
-        """Process a single file with semaphore limiting"""
+    async def process_batch(batch: list[tuple[Path, str]]) -> list[tuple[str, list[str], bool, str]]:
+        """Process a batch of distinct files (and their duplicates) with semaphore limiting"""
         async with semaphore:
+            batch_files = [md_file for md_file, _ in batch]
+            names = ", ".join(md_file.name for md_file in batch_files)
             try:
-                print(f"📄 Starting: {md_file.name}")
-                jobs_data = await extract_job_data_async(str(md_file), api_key)
-                
-                # The JSON file path is built in save_job_data_as_json
-                today = datetime.now().strftime("%Y%m%d")
-                json_path = f"firecrawl/job-data/{today}/jobscallme/json/{md_file.stem}.json"
+                print(f"📄 Starting: {names}")
+                if len(batch) == 1:
+                    md_file, content = batch[0]
+                    results = {md_file.stem: await extract_job_data_async(
+                        str(md_file), api_key, save_json=False, limiter=limiter, markdown_content=content, model=model)}
+                else:
+                    results = await extract_job_data_batch_async(
+                        batch_files, api_key, save_json=False, limiter=limiter,
+                        markdown_contents=[content for _, content in batch], model=model)
                 
-                print(f"✅ Completed: {md_file.name} - Found {jobs_data.total_jobs} job(s)")
-                return json_path, True, ""
+                outcomes = []
+                for md_file in batch_files:
+                    same_content = same_content_as[md_file]
+                    jobs_data = results.get(md_file.stem)
+                    if jobs_data is None:
+                        for failed_file in same_content:
+                            print(f"❌ Failed: {failed_file.name} - missing from batch response")
+                            outcomes.append((failed_file.name, [], False, "missing from batch response"))
+                        continue
+                    saved_paths = await save_job_data_as_json_async(jobs_data, str(md_file), today, keep_aggregate=keep_aggregate)
+                    print(f"✅ Completed: {md_file.name} - Found {jobs_data.total_jobs} job(s)")
+                    outcomes.append((md_file.name, saved_paths, True, ""))
+                    
+                    # Save the same extraction under each duplicate's own URL
+                    for duplicate in same_content[1:]:
+                        duplicate_data = fill_job_metadata(jobs_data.model_copy(deep=True), duplicate.stem)
+                        saved_paths = await save_job_data_as_json_async(duplicate_data, str(duplicate), today, keep_aggregate=keep_aggregate)
+                        print(f"✅ Completed: {duplicate.name} - duplicate of {md_file.name}")
+                        outcomes.append((duplicate.name, saved_paths, True, ""))
+                return outcomes
                 
             except Exception as e:
-                print(f"❌ Failed: {md_file.name} - {e}")
-                return "", False, str(e)
-    
-    # Process all files concurrently
-    tasks = [process_single_file(md_file) for md_file in md_files]
+                print(f"❌ Failed: {names} - {e}")
+                return [
+                    (failed_file.name, [], False, str(e))
+                    for md_file in batch_files
+                    for failed_file in same_content_as[md_file]
+                ]
+    
+    # Split the distinct files into batches and process them concurrently
+    file_iter = iter(unique_files)
+    batches = list(iter(lambda: list(islice(file_iter, batch_size)), []))
+    tasks = [process_batch(batch) for batch in batches]
     results = await asyncio.gather(*tasks, return_exceptions=True)
     
     # Collect results
     successful_files = []
+    processed_count = 0
     failed_files = []
     
-    for i, result in enumerate(results):
+    for batch, result in zip(batches, results):
         if isinstance(result, Exception):
-            failed_files.append((md_files[i].name, str(result)))
-        else:
-            json_path, success, error = result
+            failed_files.extend(
+                (failed_file.name, str(result))
+                for md_file, _ in batch
+                for failed_file in same_content_as[md_file]
+            )
+            continue
+        for filename, saved_paths, success, error in result:
             if success:
-                successful_files.append(json_path)
+                processed_count += 1
+                successful_files.extend(saved_paths)
             else:
-                failed_files.append((md_files[i].name, error))
+                failed_files.append((filename, error))
     
     # Summary
     end_time = time.time()
     processing_time = end_time - start_time
     
     print(f"\n🎉 Parallel processing completed in {processing_time:.2f} seconds!")
-    print(f"✅ Successfully processed: {len(successful_files)} files")
+    print(f"✅ Successfully processed: {processed_count} files")
     print(f"❌ Failed: {len(failed_files)} files")
     
     if failed_files:
@@ -224,19 +550,19 @@ async def process_multiple_files_async(markdown_dir: str, api_key: str, max_conc
     
     return successful_files
 
-def process_multiple_files(markdown_dir: str, api_key: str) -> list[str]:
-    """
-    Synchronous wrapper for process_multiple_files_async
-    """
-    return asyncio.run(process_multiple_files_async(markdown_dir, api_key))
-
-def process_batch_files(date_str: str = None, api_key: str = None) -> None:
+async def process_batch_files_async(date_str: str = None, api_key: str = None, max_concurrent: int = 20, batch_size: int = 1, requests_per_minute: int = 0, model: str = GEMINI_MODEL, keep_aggregate: bool = False, force: bool = False) -> None:
     """
     Process all markdown files in a date directory
     
     Args:
         date_str: Date string in YYYYMMDD format (defaults to today)
         api_key: Gemini API key
+        max_concurrent: Maximum number of concurrent API calls (default: 20)
+        batch_size: Number of markdown files sent per API call (default: 1)
+        requests_per_minute: Cap on API calls per minute, 0 for no cap (default: 0)
+        model: Gemini model to use (default: gemini-2.5-flash)
+        keep_aggregate: Also save each whole extraction to json/ (default: False)
+        force: Reprocess files that already have up-to-date output (default: False)
     """
     if not api_key:
         api_key = os.getenv('GEMINI_API_KEY')
@@ -245,9 +571,10 @@ def process_batch_files(date_str: str = None, api_key: str = None) -> None:
             print("Example: set GEMINI_API_KEY=your_api_key_here")
             return
     
-    # Use today's date if not specified
+    # Use today's date if not specified; JSON output always goes under today's folder
+    today = datetime.now().strftime("%Y%m%d")
     if not date_str:
-        date_str = datetime.now().strftime("%Y%m%d")
+        date_str = today
     
     # Directory containing markdown files (with new folder structure)
     markdown_dir = f"firecrawl/job-data/{date_str}/jobscallme/markdown"
@@ -265,32 +592,35 @@ def process_batch_files(date_str: str = None, api_key: str = None) -> None:
         return
     
     # Find all markdown files in the directory
-    markdown_path = Path(markdown_dir)
-    md_files = list(markdown_path.glob("*.md"))
+    md_files = list_markdown_files(markdown_dir)
     
     if not md_files:
         print(f"❌ No markdown files found in: {markdown_dir}")
         return
     
     # Process all files in parallel  
-    successful_files = asyncio.run(process_multiple_files_async(markdown_dir, api_key, max_concurrent=5))
+    successful_files = await process_multiple_files_async(markdown_dir, api_key, max_concurrent=max_concurrent, batch_size=batch_size, today=today, requests_per_minute=requests_per_minute, model=model, keep_aggregate=keep_aggregate, force=force)
     
     # Summary
     print("\n" + "=" * 60)
     print("🎉 PARALLEL BATCH PROCESSING COMPLETE")
-    print(f"✅ Successfully processed: {len(successful_files)} files")
-    print(f"💾 JSON files saved to: firecrawl/job-data/{date_str}/jobscallme/json/")
+    print(f"✅ JSON files written: {len(successful_files)}")
+    print(f"💾 Individual job files saved to: firecrawl/job-data/{today}/jobscallme/final/")
+    if keep_aggregate:
+        print(f"💾 Aggregate JSON files saved to: firecrawl/job-data/{today}/jobscallme/json/")
     
     if successful_files:
-        print(f"\n📊 Check the JSON files in: firecrawl/job-data/{date_str}/jobscallme/json/")
+        print(f"\n📊 Check the JSON files in: firecrawl/job-data/{today}/jobscallme/final/")
 
-def process_single_file(file_path: str, api_key: str = None) -> None:
+async def process_single_file_async(file_path: str, api_key: str = None, model: str = GEMINI_MODEL, keep_aggregate: bool = False) -> None:
     """
     Process a single markdown file
     
     Args:
         file_path: Path to the markdown file
         api_key: Gemini API key
+        model: Gemini model to use (default: gemini-2.5-flash)
+        keep_aggregate: Also save the whole extraction to json/ (default: False)
     """
     if not api_key:
         api_key = os.getenv('GEMINI_API_KEY')
@@ -306,13 +636,13 @@ def process_single_file(file_path: str, api_key: str = None) -> None:
     print(f"📄 Processing file: {file_path}")
     
     try:
-        # Extract job data (this will also save the JSON file automatically)
-        jobs_data = extract_job_data(file_path, api_key)
+        # Extract job data (this will also save the JSON files automatically)
+        jobs_data = await extract_job_data_async(file_path, api_key, model=model, keep_aggregate=keep_aggregate)
         
         # Print the extracted data as JSON
         print(f"\n📊 Extracted {jobs_data.total_jobs} Job(s):")
         print("-" * 50)
-        print(json.dumps(jobs_data.model_dump(), indent=2, ensure_ascii=False))
+        print(jobs_data.model_dump_json(indent=2))
         
     except Exception as e:
         print(f"❌ Error extracting job data: {e}")
@@ -335,6 +665,21 @@ Examples (run from project root directory):
 
   # Process with custom API key and reduced concurrency for rate limiting
   python firecrawl/jobscallme_extract.py --api-key YOUR_API_KEY --max-concurrent 3
+
+  # Stay under a 15 requests-per-minute quota
+  python firecrawl/jobscallme_extract.py --rpm 15
+
+  # Send 8 markdown files per Gemini request
+  python firecrawl/jobscallme_extract.py --batch-size 8
+
+  # Use the cheaper Flash-Lite model (falls back to Flash on invalid output)
+  python firecrawl/jobscallme_extract.py --model gemini-2.5-flash-lite
+
+  # Also write the per-page aggregate files to json/ alongside final/
+  python firecrawl/jobscallme_extract.py --keep-aggregate
+
+  # Reprocess every file, even those already extracted today
+  python firecrawl/jobscallme_extract.py --force
         """
     )
     
@@ -359,8 +704,41 @@ Examples (run from project root directory):
     parser.add_argument(
         '--max-concurrent', '-c',
         type=int,
-        default=5,
-        help='Maximum number of concurrent API calls (default: 5)'
+        default=20,
+        help='Maximum number of concurrent API calls (default: 20)'
+    )
+    
+    parser.add_argument(
+        '--rpm',
+        type=int,
+        default=0,
+        help='Maximum API calls per minute, 0 for no limit (default: 0); 429 responses are retried with backoff either way'
+    )
+    
+    parser.add_argument(
+        '--batch-size', '-b',
+        type=int,
+        default=1,
+        help='Number of markdown files sent per API call (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--model', '-m',
+        type=str,
+        default=GEMINI_MODEL,
+        help=f'Gemini model to use (default: {GEMINI_MODEL}); output that fails schema validation is retried on {GEMINI_MODEL}'
+    )
+    
+    parser.add_argument(
+        '--keep-aggregate',
+        action='store_true',
+        help='Also write each page\'s full extraction to json/ (individual jobs always go to final/)'
+    )
+    
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Reprocess markdown files whose job files are already newer than the markdown'
     )
     
     args = parser.parse_args()
@@ -371,12 +749,17 @@ Examples (run from project root directory):
         print("❌ Please provide API key via --api-key or set GEMINI_API_KEY environment variable")
         return
     
+    # One event loop for the whole run
+    asyncio.run(main_async(args, api_key))
+
+async def main_async(args: argparse.Namespace, api_key: str) -> None:
+    """Run the requested processing mode on a single event loop"""
     if args.file:
         # Process single file
-        process_single_file(args.file, api_key)
+        await process_single_file_async(args.file, api_key, args.model, args.keep_aggregate)
     else:
         # Process batch files
-        process_batch_files(args.date, api_key)
+        await process_batch_files_async(args.date, api_key, args.max_concurrent, args.batch_size, args.rpm, args.model, args.keep_aggregate, args.force)
 
 if __name__ == "__main__":
     main()
@@ -7,14 +7,27 @@ This script reads all JSON files from the jobscallme/json directory,
 extracts each job object from the 'jobs' array, and saves them as
 individual JSON files in the final directory.
 
+Deprecated: jobscallme_extract.py now writes the individual files to the
+final directory itself. This script is only needed for json/ aggregates
+written with --keep-aggregate or by older runs.
+
 Usage: python populate_json.py
 """
 
 import os
 import json
+import asyncio
+import aiofiles
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used instead
+    orjson = None
 
 
 def get_json_files(json_dir: str) -> List[Path]:
@@ -27,17 +40,53 @@ def get_json_files(json_dir: str) -> List[Path]:
     Returns:
         List[Path]: List of JSON file paths
     """
-    json_path = Path(json_dir)
-    if not json_path.exists():
+    if not os.path.isdir(json_dir):
         print(f"❌ Directory not found: {json_dir}")
         return []
     
-    json_files = list(json_path.glob("*.json"))
+    # One scandir pass; DirEntry already knows the file type
+    with os.scandir(json_dir) as entries:
+        json_files = [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith('.json') and not entry.name.startswith('.') and entry.is_file(follow_symlinks=False)
+        ]
     print(f"📄 Found {len(json_files)} JSON files")
     return json_files
 
 
-def process_json_file(json_file: Path, output_dir: Path) -> int:
+def saved_job_mtimes(final_dir: Path) -> Dict[str, int]:
+    """
+    Map each source stem with {stem}-NNN.json files in final_dir to their newest mtime
+    
+    Args:
+        final_dir (Path): Output directory for individual files
+        
+    Returns:
+        Dict[str, int]: Newest st_mtime_ns per source stem
+    """
+    mtimes: Dict[str, int] = {}
+    try:
+        with os.scandir(final_dir) as entries:
+            for entry in entries:
+                stem, sep, number = entry.name.removesuffix('.json').rpartition('-')
+                if not sep or not number.isdigit() or not entry.name.endswith('.json'):
+                    continue
+                mtime = entry.stat().st_mtime_ns
+                if mtime > mtimes.get(stem, 0):
+                    mtimes[stem] = mtime
+    except FileNotFoundError:
+        pass
+    return mtimes
+
+
+def dump_json(payload: Any) -> bytes:
+    """Serialize a JSON document with 2-space indent, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+async def process_json_file_async(json_file: Path, output_dir: Path) -> int:
     """
     Process a single JSON file and extract individual job objects
     
@@ -52,8 +101,9 @@ def process_json_file(json_file: Path, output_dir: Path) -> int:
         print(f"\n📄 Processing: {json_file.name}")
         
         # Read the JSON file
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        async with aiofiles.open(json_file, 'rb') as f:
+            raw = await f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         
         # Check if the file has a 'jobs' array
         if not isinstance(data, dict) or 'jobs' not in data:
@@ -74,21 +124,20 @@ def process_json_file(json_file: Path, output_dir: Path) -> int:
         # Extract base filename (without extension)
         base_name = json_file.stem
         
-        # Process each job
-        jobs_created = 0
-        for i, job in enumerate(jobs, 1):
+        async def write_job(i: int, job: Any) -> None:
             # Create individual filename
             individual_filename = f"{base_name}-{i:03d}.json"
-            individual_path = output_dir / individual_filename
             
             # Save individual job as JSON
-            with open(individual_path, 'w', encoding='utf-8') as f:
-                json.dump(job, f, indent=2, ensure_ascii=False)
+            async with aiofiles.open(output_dir / individual_filename, 'wb') as f:
+                await f.write(dump_json(job))
             
             print(f"   💾 Created: {individual_filename}")
-            jobs_created += 1
         
-        return jobs_created
+        # Write every job file concurrently
+        await asyncio.gather(*(write_job(i, job) for i, job in enumerate(jobs, 1)))
+        
+        return len(jobs)
         
     except json.JSONDecodeError as e:
         print(f"❌ Invalid JSON in {json_file.name}: {e}")
@@ -98,12 +147,30 @@ def process_json_file(json_file: Path, output_dir: Path) -> int:
         return 0
 
 
-def populate_individual_json_files(date_str: str = None) -> None:
+async def process_json_files_async(json_files: List[Path], output_dir: Path) -> List[int]:
+    """
+    Process JSON files one after another on a single event loop
+    
+    Files are handled sequentially so only one file's job writes are open at a time.
+    """
+    return [await process_json_file_async(json_file, output_dir) for json_file in json_files]
+
+
+def process_json_files(json_files: List[Path], output_dir: Path) -> List[int]:
+    """
+    Worker process entry point: runs process_json_files_async on the worker's own event loop
+    """
+    return asyncio.run(process_json_files_async(json_files, output_dir))
+
+
+async def populate_individual_json_files_async(date_str: str = None, max_workers: Optional[int] = None, force: bool = False) -> None:
     """
     Main function to populate individual JSON files
     
     Args:
         date_str (str): Date string in YYYYMMDD format (defaults to today)
+        max_workers (int): Number of worker processes (defaults to CPU count)
+        force (bool): Re-split files whose individual files are already up to date
     """
     # Use today's date if not specified
     if not date_str:
@@ -138,20 +205,46 @@ def populate_individual_json_files(date_str: str = None) -> None:
     if not json_files:
         return
     
-    # Process each JSON file
-    total_jobs_created = 0
-    processed_files = 0
+    # Skip files that were already split after they last changed
+    skipped_files = 0
+    if not force:
+        saved_mtimes = saved_job_mtimes(final_dir)
+        pending_files = [
+            json_file for json_file in json_files
+            if json_file.stem not in saved_mtimes or json_file.stat().st_mtime_ns >= saved_mtimes[json_file.stem]
+        ]
+        skipped_files = len(json_files) - len(pending_files)
+        if skipped_files:
+            print(f"⏭️  Skipping {skipped_files} already populated file(s) (use --force to redo them)")
+        json_files = pending_files
+        if not json_files:
+            print("✅ Nothing to do, every JSON file is already populated")
+            return
+    
+    # Process the JSON files in parallel; parsing and writing is CPU-bound.
+    # Each worker runs one event loop over a chunk of files.
+    max_workers = min(max(1, max_workers or os.cpu_count() or 1), len(json_files))
+    if max_workers == 1:
+        results = await process_json_files_async(json_files, final_dir)
+    else:
+        loop = asyncio.get_running_loop()
+        chunks = [json_files[i:i + 8] for i in range(0, len(json_files), 8)]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunk_results = await asyncio.gather(*(
+                loop.run_in_executor(executor, partial(process_json_files, chunk, final_dir))
+                for chunk in chunks
+            ))
+        results = [jobs_created for chunk_result in chunk_results for jobs_created in chunk_result]
     
-    for json_file in json_files:
-        jobs_created = process_json_file(json_file, final_dir)
-        total_jobs_created += jobs_created
-        if jobs_created > 0:
-            processed_files += 1
+    total_jobs_created = sum(results)
+    processed_files = sum(1 for jobs_created in results if jobs_created > 0)
     
     # Summary
     print(f"\n" + "=" * 60)
     print(f"🎉 POPULATION COMPLETE")
     print(f"✅ Processed files: {processed_files}/{len(json_files)}")
+    if skipped_files:
+        print(f"⏭️  Skipped (already populated): {skipped_files}")
     print(f"✅ Total individual job files created: {total_jobs_created}")
     print(f"📁 Individual files saved in: {final_dir}")
     
@@ -174,6 +267,12 @@ Examples:
 
   # Process JSON files from a specific date
   python populate_json.py --date 20250828
+
+  # Limit the number of worker processes
+  python populate_json.py --workers 4
+
+  # Re-split every file, even those already populated
+  python populate_json.py --force
         """
     )
     
@@ -183,10 +282,22 @@ Examples:
         help='Date in YYYYMMDD format (default: today)'
     )
     
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        help='Number of worker processes (default: CPU count)'
+    )
+    
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-split JSON files whose individual files are already newer than the source'
+    )
+    
     args = parser.parse_args()
     
-    # Run the population process
-    populate_individual_json_files(args.date)
+    # Run the population process on a single event loop
+    asyncio.run(populate_individual_json_files_async(args.date, args.workers, args.force))
 
 
 if __name__ == "__main__":
@@ -11,19 +11,68 @@ Requirements:
 """
 
 import os
+import argparse
+import base64
 import boto3
+import hashlib
 import json
+import logging
+import tarfile
+import tempfile
+import threading
+import time
+from boto3.s3.transfer import S3Transfer, TransferConfig
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
+try:
+    import zstandard
+except ImportError:  # only needed for --compress
+    zstandard = None
+
+logger = logging.getLogger("r2uploader")
+
+MB = 1024 * 1024
+MULTIPART_THRESHOLD = 8 * MB
+MANIFEST_PATH = Path("firecrawl/job-data/cache/upload-manifest.json")
+ZSTD_LEVEL = 10
+# A successful bucket check is remembered for a day so most runs skip the HEAD
+CONNECTION_CHECK_DIR = Path.home() / ".cache" / "r2uploader"
+CONNECTION_CHECK_TTL = 24 * 60 * 60
+# botocore retries throttling, 5xx and dropped connections itself; adaptive
+# mode also paces new requests while R2 is throttling
+UPLOAD_MAX_ATTEMPTS = 10
+REQUIRED_ENV_VARS = ('R2_ACCOUNT_ID', 'R2_ACCESS_KEY_ID', 'R2_SECRET_ACCESS_KEY', 'R2_BUCKET_NAME')
+
+
+class LocalFile(NamedTuple):
+    """A JSON file to upload, as read from the directory scan."""
+    name: str
+    path: str
+    size: int
+    mtime_ns: int
+
+
+def file_md5(path: str) -> str:
+    """Hex MD5 of a file, read in 1 MB chunks."""
+    digest = hashlib.md5(usedforsecurity=False)
+    with open(path, 'rb') as f:
+        while chunk := f.read(MB):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
 class R2Uploader:
     """Handles uploading files to Cloudflare R2 storage."""
     
-    def __init__(self, account_id: str, access_key_id: str, secret_access_key: str, bucket_name: str):
+    def __init__(self, account_id: str, access_key_id: str, secret_access_key: str, bucket_name: str,
+                 max_workers: int = 16, skip_unchanged: bool = True, compress: bool = False,
+                 hash_prefix: bool = False, check_remote: bool = False):
         """
         Initialize R2 uploader.
         
@@ -32,103 +81,294 @@ class R2Uploader:
             access_key_id: R2 access key ID
             secret_access_key: R2 secret access key
             bucket_name: R2 bucket name
+            max_workers: Number of files uploaded concurrently
+            skip_unchanged: Skip files whose identical copy is already in the bucket
+            compress: Upload zstd-compressed <name>.json.zst objects (needs zstandard)
+            hash_prefix: Put objects under <hh>/<date>/ to spread keys across prefixes
+            check_remote: HEAD objects missing from the local manifest before uploading them
         """
+        if compress and zstandard is None:
+            raise ImportError("compress=True requires the zstandard package (pip install zstandard)")
+        
         self.account_id = account_id
         self.bucket_name = bucket_name
+        self.max_workers = max(1, max_workers)
+        self.skip_unchanged = skip_unchanged
+        self.compress = compress
+        self.hash_prefix = hash_prefix
+        self.check_remote = check_remote
+        
+        # ZstdCompressor instances must not be shared between threads
+        self._local = threading.local()
+        
+        # bucket/key -> [size, mtime_ns, md5] of the local file last uploaded there
+        self.manifest: Dict[str, List[Any]] = {}
+        self.manifest_lock = threading.Lock()
+        self.skipped_files = 0
         
-        # Create S3 client for R2
+        # Create S3 client for R2; one pooled keep-alive connection per upload
+        # thread, with adaptive retries that back off when R2 throttles
         self.s3_client = boto3.client(
             's3',
             endpoint_url=f'https://{account_id}.r2.cloudflarestorage.com',
             aws_access_key_id=access_key_id,
             aws_secret_access_key=secret_access_key,
-            region_name='auto'  # R2 uses 'auto' region
+            region_name='auto',  # R2 uses 'auto' region
+            config=Config(
+                max_pool_connections=self.max_workers,
+                retries={'max_attempts': UPLOAD_MAX_ATTEMPTS, 'mode': 'adaptive'},
+                tcp_keepalive=True
+            )
+        )
+        
+        # One transfer manager for the whole run so its worker threads and
+        # keep-alive connections are reused across files
+        self.transfer_config = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD,
+            multipart_chunksize=8 * MB,
+            max_concurrency=self.max_workers,
+            use_threads=True
         )
+        self.transfer = S3Transfer(self.s3_client, self.transfer_config)
     
-    def test_connection(self) -> bool:
-        """Test connection to R2 bucket."""
+    def test_connection(self, force: bool = False) -> bool:
+        """
+        Test connection to R2 bucket.
+        
+        Args:
+            force: Always call head_bucket, even if a recent check succeeded
+            
+        Returns:
+            True if the bucket is reachable (or was within CONNECTION_CHECK_TTL)
+        """
+        check_file = CONNECTION_CHECK_DIR / f"{self.account_id}-{self.bucket_name}.ok"
+        if not force:
+            try:
+                if time.time() - check_file.stat().st_mtime < CONNECTION_CHECK_TTL:
+                    logger.info("✅ R2 bucket %s checked recently (use --force-check to recheck)", self.bucket_name)
+                    return True
+            except OSError:
+                pass
+        
         try:
             self.s3_client.head_bucket(Bucket=self.bucket_name)
-            print(f"✅ Successfully connected to R2 bucket: {self.bucket_name}")
+            logger.info("✅ Successfully connected to R2 bucket: %s", self.bucket_name)
+            try:
+                check_file.parent.mkdir(parents=True, exist_ok=True)
+                check_file.touch()
+            except OSError:
+                pass  # the cache is best-effort
             return True
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == '404':
-                print(f"❌ Bucket '{self.bucket_name}' not found")
+                logger.error("❌ Bucket '%s' not found", self.bucket_name)
             elif error_code == '403':
-                print(f"❌ Access denied to bucket '{self.bucket_name}'")
+                logger.error("❌ Access denied to bucket '%s'", self.bucket_name)
             else:
-                print(f"❌ Error accessing bucket: {e}")
+                logger.error("❌ Error accessing bucket: %s", e)
             return False
         except NoCredentialsError:
-            print("❌ No credentials found. Please check your access keys.")
+            logger.error("❌ No credentials found. Please check your access keys.")
             return False
         except Exception as e:
-            print(f"❌ Connection error: {e}")
+            logger.error("❌ Connection error: %s", e)
             return False
     
     def get_today_folder(self) -> str:
         """Get today's date in YYYYMMDD format for folder naming."""
         return datetime.now().strftime("%Y%m%d")
     
-    def find_json_files(self, directory_path: str) -> List[Path]:
+    def find_json_files(self, directory_path: str) -> Iterator[LocalFile]:
         """
-        Find all JSON files in the specified directory.
+        Lazily find JSON files in the specified directory.
         
         Args:
             directory_path: Path to search for JSON files
             
         Returns:
-            List of Path objects for JSON files
+            Iterator of LocalFile tuples, yielded as the directory is read
         """
-        directory = Path(directory_path)
-        if not directory.exists():
-            print(f"❌ Directory not found: {directory_path}")
-            return []
+        if not os.path.isdir(directory_path):
+            logger.error("❌ Directory not found: %s", directory_path)
+            return
         
-        json_files = list(directory.glob("*.json"))
-        print(f"📁 Found {len(json_files)} JSON files in {directory_path}")
-        return json_files
+        # Take name, path, size and mtime from the scan so uploads never stat or build a Path
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.is_file():
+                    stat = entry.stat()
+                    yield LocalFile(entry.name, entry.path, stat.st_size, stat.st_mtime_ns)
+    
+    def build_extra_args(self) -> Dict[str, Any]:
+        """Build the object headers and metadata shared by every upload in a run."""
+        extra_args = {
+            'ContentType': 'application/json',
+            'Metadata': {
+                'source': 'jobscallme-firecrawl',
+                'upload_date': datetime.now().isoformat()
+            }
+        }
+        if self.compress:
+            extra_args['ContentEncoding'] = 'zstd'
+        return extra_args
+    
+    def compress_body(self, data: bytes) -> bytes:
+        """zstd-compress an upload body with this thread's compressor."""
+        compressor = getattr(self._local, 'compressor', None)
+        if compressor is None:
+            compressor = self._local.compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+        return compressor.compress(data)
+    
+    def load_manifest(self) -> None:
+        """Load the local record of previous uploads."""
+        try:
+            with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+                self.manifest = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.manifest = {}
+    
+    def save_manifest(self) -> None:
+        """Persist the local record of uploads for the next run."""
+        MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f)
     
-    def upload_file(self, file_path: Path, folder_name: str) -> bool:
+    def _already_uploaded(self, s3_key: str, size: int, md5: str) -> bool:
+        """
+        Check whether the bucket already holds an identical object.
+        
+        Args:
+            s3_key: Remote object key
+            size: Local file size in bytes
+            md5: Hex MD5 of the local file
+            
+        Returns:
+            True if the remote ETag and size match the local file
+        """
+        try:
+            response = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+        except ClientError:
+            return False
+        # For single-part uploads the ETag is the MD5 of the body
+        return response['ContentLength'] == size and response['ETag'].strip('"') == md5
+    
+    def object_key(self, file_name: str, folder_name: str) -> str:
+        """
+        Build the remote key for a local file.
+        
+        Args:
+            file_name: Local file name
+            folder_name: Remote folder name (date folder)
+            
+        Returns:
+            <folder>/<name>, with a .zst suffix when compressing and a
+            2-hex-digit blake2b(name) prefix when hash_prefix is set
+        """
+        s3_key = f"{folder_name}/{file_name}.zst" if self.compress else f"{folder_name}/{file_name}"
+        if self.hash_prefix:
+            s3_key = f"{hashlib.blake2b(file_name.encode(), digest_size=1).hexdigest()}/{s3_key}"
+        return s3_key
+    
+    def upload_file(self, local_file: LocalFile, folder_name: str,
+                    extra_args: Optional[Dict[str, Any]] = None) -> bool:
         """
         Upload a single file to R2 storage.
         
         Args:
-            file_path: Local file path
+            local_file: File from find_json_files
             folder_name: Remote folder name (date folder)
+            extra_args: Shared object headers from build_extra_args (built here if omitted)
             
         Returns:
             True if successful, False otherwise
         """
         try:
             # Create the S3 key (remote path)
-            s3_key = f"{folder_name}/{file_path.name}"
+            name, path, size, mtime_ns = local_file
+            s3_key = self.object_key(name, folder_name)
+            if extra_args is None:
+                extra_args = self.build_extra_args()
             
-            # Upload the file
-            self.s3_client.upload_file(
-                str(file_path),
-                self.bucket_name,
-                s3_key,
-                ExtraArgs={
-                    'ContentType': 'application/json',
-                    'Metadata': {
-                        'source': 'jobscallme-firecrawl',
-                        'upload_date': datetime.now().isoformat()
-                    }
-                }
-            )
+            manifest_key = f"{self.bucket_name}/{s3_key}"
+            file_state = [size, mtime_ns]
+            
+            # Fast path: this exact file was uploaded to this key before
+            record = self.manifest.get(manifest_key)
+            if self.skip_unchanged and record and record[:2] == file_state:
+                return self._skip(name, s3_key)
+            
+            # Compressed bodies are built in memory and always sent with put_object
+            small_file = self.compress or size < MULTIPART_THRESHOLD
+            data = None
+            if small_file:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            if self.compress:
+                data = self.compress_body(data)
+            # One MD5 serves both the skip check and the Content-MD5 integrity header
+            content_md5 = None
+            if small_file:
+                digest = hashlib.md5(data, usedforsecurity=False).digest()
+                md5 = digest.hex()
+                content_md5 = base64.b64encode(digest).decode('ascii')
+            else:
+                md5 = file_md5(path)
+            body_size = len(data) if small_file else size
+            
+            # Touched but unchanged since the recorded upload, or (only with
+            # check_remote, since it costs a HEAD per new key) already in the bucket
+            if self.skip_unchanged and (
+                (record and record[2] == md5)
+                or (self.check_remote and not record and self._already_uploaded(s3_key, body_size, md5))
+            ):
+                with self.manifest_lock:
+                    self.manifest[manifest_key] = file_state + [md5]
+                return self._skip(name, s3_key)
+            
+            self._send(path, s3_key, data, content_md5, extra_args)
+            
+            with self.manifest_lock:
+                self.manifest[manifest_key] = file_state + [md5]
             
-            print(f"✅ Uploaded: {file_path.name} -> {s3_key}")
+            logger.debug("✅ Uploaded: %s -> %s", name, s3_key)
             return True
             
         except ClientError as e:
-            print(f"❌ Failed to upload {file_path.name}: {e}")
+            logger.error("❌ Failed to upload %s: %s", local_file.name, e)
             return False
         except Exception as e:
-            print(f"❌ Unexpected error uploading {file_path.name}: {e}")
+            logger.error("❌ Unexpected error uploading %s: %s", local_file.name, e)
             return False
     
+    def _send(self, path: str, s3_key: str, data: Optional[bytes],
+              content_md5: Optional[str], extra_args: Dict[str, Any]) -> None:
+        """
+        Send one object: in-memory bodies with put_object, large files through the transfer manager.
+        
+        content_md5 is the base64 MD5 of data; R2 rejects the PUT if the body it received differs.
+        Multipart uploads carry no whole-object MD5.
+        """
+        # Files below the multipart threshold go up as one PUT straight
+        # from memory, skipping the transfer manager's per-call overhead
+        if data is not None:
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                Body=data,
+                ContentMD5=content_md5,
+                **extra_args
+            )
+        else:
+            self.transfer.upload_file(path, self.bucket_name, s3_key, extra_args=extra_args)
+    
+    def _skip(self, name: str, s3_key: str) -> bool:
+        """Record an unchanged file as skipped; it counts as a successful upload."""
+        with self.manifest_lock:
+            self.skipped_files += 1
+        logger.debug("⏭️  Unchanged: %s -> %s", name, s3_key)
+        return True
+    
     def upload_all_json_files(self, source_directory: str) -> Tuple[int, int]:
         """
         Upload all JSON files from source directory to R2.
@@ -141,33 +381,100 @@ class R2Uploader:
         """
         # Get today's folder name
         folder_name = self.get_today_folder()
-        print(f"📅 Using folder name: {folder_name}")
-        
-        # Find all JSON files
-        json_files = self.find_json_files(source_directory)
-        if not json_files:
-            print("❌ No JSON files found to upload")
-            return 0, 0
+        logger.info("📅 Using folder name: %s", folder_name)
         
         # Upload each file
         successful_uploads = 0
-        total_files = len(json_files)
+        total_files = 0
+        
+        logger.info("🚀 Starting upload from %s (%d at a time)...", source_directory, self.max_workers)
+        logger.info("-" * 50)
         
-        print(f"\n🚀 Starting upload of {total_files} files...")
-        print("-" * 50)
+        # Headers and timestamp are the same for every file; botocore only reads them
+        extra_args = self.build_extra_args()
+        self.load_manifest()
+        self.skipped_files = 0
         
-        for i, file_path in enumerate(json_files, 1):
-            print(f"[{i}/{total_files}] ", end="")
-            if self.upload_file(file_path, folder_name):
-                successful_uploads += 1
+        # Uploads are network-bound and independent, so run them on a thread pool.
+        # Files are submitted while the directory is still being read.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = []
+            for local_file in self.find_json_files(source_directory):
+                futures.append(executor.submit(self.upload_file, local_file, folder_name, extra_args))
+                total_files += 1
+            # Per-file lines are DEBUG; report progress every ~10% from this thread only
+            progress_step = max(1, total_files // 10)
+            for completed, future in enumerate(as_completed(futures), 1):
+                if future.result():
+                    successful_uploads += 1
+                if completed % progress_step == 0 or completed == total_files:
+                    logger.info("   [%d/%d] done", completed, total_files)
         
-        print("-" * 50)
-        print(f"📊 Upload Summary:")
-        print(f"   ✅ Successful: {successful_uploads}")
-        print(f"   ❌ Failed: {total_files - successful_uploads}")
-        print(f"   📁 Remote folder: {folder_name}")
+        if not total_files:
+            logger.error("❌ No JSON files found to upload")
+            return 0, 0
+        self.save_manifest()
+        
+        logger.info("-" * 50)
+        logger.info("📊 Upload Summary:")
+        logger.info("   📁 Files found: %d", total_files)
+        logger.info("   ✅ Successful: %d", successful_uploads)
+        if self.skipped_files:
+            logger.info("   ⏭️  Unchanged (not re-sent): %d", self.skipped_files)
+        logger.info("   ❌ Failed: %d", total_files - successful_uploads)
+        logger.info("   📁 Remote folder: %s", folder_name)
         
         return successful_uploads, total_files
+    
+    def upload_as_archive(self, source_directory: str) -> Tuple[int, int]:
+        """
+        Upload all JSON files from source directory as a single tar.zst object.
+        
+        Args:
+            source_directory: Local directory containing JSON files
+            
+        Returns:
+            Tuple of (files_uploaded, total_files); all or nothing
+        """
+        if zstandard is None:
+            logger.error("❌ Archive uploads require the zstandard package (pip install zstandard)")
+            return 0, 0
+        
+        folder_name = self.get_today_folder()
+        s3_key = f"{folder_name}/batch.tar.zst"
+        logger.info("📅 Using folder name: %s", folder_name)
+        
+        # Sorted so the same files always produce the same archive
+        local_files = sorted(self.find_json_files(source_directory))
+        if not local_files:
+            logger.error("❌ No JSON files found to upload")
+            return 0, 0
+        
+        logger.info("📦 Packing %d files into %s...", len(local_files), s3_key)
+        try:
+            with tempfile.TemporaryFile() as archive:
+                # Stream the tar through zstd into a temp file so the archive is never fully in memory
+                compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+                with compressor.stream_writer(archive, closefd=False) as writer:
+                    with tarfile.open(fileobj=writer, mode='w|', format=tarfile.PAX_FORMAT) as tar:
+                        for local_file in local_files:
+                            tar.add(local_file.path, arcname=local_file.name)
+                archive_size = archive.tell()
+                archive.seek(0)
+                
+                extra_args = self.build_extra_args()
+                extra_args['ContentType'] = 'application/x-tar'
+                extra_args['ContentEncoding'] = 'zstd'
+                self.s3_client.upload_fileobj(
+                    archive, self.bucket_name, s3_key,
+                    ExtraArgs=extra_args, Config=self.transfer_config
+                )
+        except (ClientError, OSError) as e:
+            logger.error("❌ Failed to upload archive %s: %s", s3_key, e)
+            return 0, len(local_files)
+        
+        logger.info("✅ Uploaded: %d files -> %s (%.1f MB)", len(local_files), s3_key, archive_size / MB)
+        return len(local_files), len(local_files)
 
 
 def get_credentials_from_env() -> Tuple[str, str, str, str]:
@@ -177,20 +484,8 @@ def get_credentials_from_env() -> Tuple[str, str, str, str]:
     Returns:
         Tuple of (account_id, access_key_id, secret_access_key, bucket_name)
     """
-    account_id = os.getenv('R2_ACCOUNT_ID')
-    access_key_id = os.getenv('R2_ACCESS_KEY_ID')
-    secret_access_key = os.getenv('R2_SECRET_ACCESS_KEY')
-    bucket_name = os.getenv('R2_BUCKET_NAME')
-    
-    missing_vars = []
-    if not account_id:
-        missing_vars.append('R2_ACCOUNT_ID')
-    if not access_key_id:
-        missing_vars.append('R2_ACCESS_KEY_ID')
-    if not secret_access_key:
-        missing_vars.append('R2_SECRET_ACCESS_KEY')
-    if not bucket_name:
-        missing_vars.append('R2_BUCKET_NAME')
+    values = {var: os.environ.get(var) for var in REQUIRED_ENV_VARS}
+    missing_vars = [var for var, value in values.items() if not value]
     
     if missing_vars:
         print("❌ Missing required environment variables:")
@@ -198,17 +493,102 @@ def get_credentials_from_env() -> Tuple[str, str, str, str]:
             print(f"   - {var}")
         print("\nPlease set these environment variables and try again.")
         print("Example:")
-        print("set R2_ACCOUNT_ID=your_account_id")
-        print("set R2_ACCESS_KEY_ID=your_access_key")
-        print("set R2_SECRET_ACCESS_KEY=your_secret_key")
-        print("set R2_BUCKET_NAME=your_bucket_name")
-        return None, None, None, None
+        for var in REQUIRED_ENV_VARS:
+            print(f"set {var}=your_{var.removeprefix('R2_').lower()}")
+        return (None,) * len(REQUIRED_ENV_VARS)
     
-    return account_id, access_key_id, secret_access_key, bucket_name
+    return tuple(values[var] for var in REQUIRED_ENV_VARS)
 
 
 def main():
     """Main function to run the upload process."""
+    parser = argparse.ArgumentParser(
+        description="Upload job JSON files to Cloudflare R2",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples (run from project root directory):
+  # Upload new and changed files; unchanged ones are skipped
+  python firecrawl/upload.py
+
+  # Re-send every file, even ones already in the bucket
+  python firecrawl/upload.py --force
+
+  # Skip files already in the bucket even without a local manifest record
+  python firecrawl/upload.py --check-remote
+
+  # Upload the whole folder as one <date>/batch.tar.zst object
+  python firecrawl/upload.py --archive
+
+  # Spread objects over 256 <hh>/<date>/ key prefixes
+  python firecrawl/upload.py --hash-prefix
+
+  # Keep more uploads in flight for large runs
+  python firecrawl/upload.py --workers 64
+
+  # Re-check the bucket with R2 instead of trusting a check from the last 24h
+  python firecrawl/upload.py --force-check
+
+  # Upload zstd-compressed <name>.json.zst objects instead of plain JSON
+  python firecrawl/upload.py --compress
+        """
+    )
+    
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Upload every file, even when an identical copy is already in the bucket'
+    )
+    
+    parser.add_argument(
+        '--archive',
+        action='store_true',
+        help='Upload all files as a single <date>/batch.tar.zst object instead of one object per file'
+    )
+    
+    parser.add_argument(
+        '--hash-prefix',
+        action='store_true',
+        help='Store objects as <hh>/<date>/<name>, where hh is a 2-hex-digit hash of the file name'
+    )
+    
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=16,
+        help='Number of files uploaded concurrently (default: 16)'
+    )
+    
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Log every uploaded and skipped file, not just failures and progress'
+    )
+    
+    parser.add_argument(
+        '--force-check',
+        action='store_true',
+        help='Check the bucket with R2 even if a check in the last 24 hours succeeded'
+    )
+    
+    parser.add_argument(
+        '--check-remote',
+        action='store_true',
+        help='Before uploading a file with no local manifest record, check the bucket for an identical object'
+    )
+    
+    parser.add_argument(
+        '--compress',
+        action='store_true',
+        help='Compress each file with zstd and upload it as <name>.json.zst with Content-Encoding: zstd'
+    )
+    
+    args = parser.parse_args()
+    
+    # Upload threads log through one handler instead of racing on print()
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+    
     print("🚀 Cloudflare R2 JSON File Uploader")
     print("=" * 40)
     
@@ -218,10 +598,16 @@ def main():
         sys.exit(1)
     
     # Initialize uploader
-    uploader = R2Uploader(account_id, access_key_id, secret_access_key, bucket_name)
+    try:
+        uploader = R2Uploader(account_id, access_key_id, secret_access_key, bucket_name,
+                              max_workers=args.workers, skip_unchanged=not args.force, compress=args.compress,
+                              hash_prefix=args.hash_prefix, check_remote=args.check_remote)
+    except ImportError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
     
     # Test connection
-    if not uploader.test_connection():
+    if not uploader.test_connection(force=args.force_check):
         sys.exit(1)
     
     # Define source directory
@@ -234,7 +620,10 @@ def main():
         sys.exit(1)
     
     # Upload files
-    successful, total = uploader.upload_all_json_files(source_dir)
+    if args.archive:
+        successful, total = uploader.upload_as_archive(source_dir)
+    else:
+        successful, total = uploader.upload_all_json_files(source_dir)
     
     if successful == total:
         print(f"\n🎉 All {total} files uploaded successfully!")